@@ -1,25 +1,30 @@
 """Spotify playback backend using raspotify and Spotify Web API."""
+import concurrent.futures
 import json
 import logging
+import os
+import queue
 import random
+import re
+import shutil
 import subprocess
 import threading
 import time
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Optional
 
-try:
-    import spotipy
-    from spotipy.oauth2 import SpotifyOAuth
-    SPOTIPY_AVAILABLE = True
-except ImportError:
-    SPOTIPY_AVAILABLE = False
-
-try:
-    import dbus
-    DBUS_AVAILABLE = True
-except ImportError:
-    DBUS_AVAILABLE = False
+# spotipy/requests and dbus are slow to import on a Pi, and this module is loaded at
+# startup even when no Spotify source is ever played, so they are imported on first
+# use by _import_spotipy()/_import_dbus() and bound to these module globals
+spotipy = None
+SpotifyOAuth = None
+SpotifyException = None
+requests = None
+HTTPAdapter = None
+Retry = None
+dbus = None
+_dbus_import_failed = False
 
 from backends.base import BaseBackend, BackendError
 from utils.sound_feedback import (
@@ -35,13 +40,298 @@ logger = logging.getLogger(__name__)
 # Configuration file path
 # Try project directory first, then fall back to home directory for backwards compatibility
 _PROJECT_DIR = Path(__file__).parent.parent.absolute()
-if (_PROJECT_DIR / "config" / "spotify_api_config.json").exists() or (_PROJECT_DIR / "config" / "spotify_api_config.json.example").exists():
-    CONFIG_FILE = _PROJECT_DIR / "config" / "spotify_api_config.json"
+_PROJECT_CONFIG_FILE = os.path.join(str(_PROJECT_DIR), "config", "spotify_api_config.json")
+if os.path.exists(_PROJECT_CONFIG_FILE) or os.path.exists(_PROJECT_CONFIG_FILE + ".example"):
+    CONFIG_FILE = Path(_PROJECT_CONFIG_FILE)
     CACHE_DIR = _PROJECT_DIR  # Cache in project root
 else:
     CONFIG_FILE = Path.home() / "rodrigo_radio" / "spotify_api_config.json"
     CACHE_DIR = Path.home() / "rodrigo_radio"  # Cache in home directory
 
+# systemd unit that runs librespot
+RASPOTIFY_UNIT = "raspotify.service"
+
+# Status-check commands, resolved once at import and run with a minimal environment
+_SUBPROCESS_ENV = {'PATH': '/usr/sbin:/usr/bin:/sbin:/bin'}
+_SYSTEMCTL = shutil.which('systemctl') or 'systemctl'
+_PGREP = shutil.which('pgrep') or 'pgrep'
+
+# Device names that identify the raspotify/librespot device
+# Common names: "raspotify", "Raspberry Pi", "raspberry", "librespot", "Rodrigo's Radio", etc.
+_DEVICE_KEYWORD_RE = re.compile(r"raspotify|raspberry|librespot|\bpi\b|rodrigo'?s? radio", re.IGNORECASE)
+
+# Exception messages/type names that indicate a network problem rather than an API error
+_NET_ERR_RE = re.compile(r"network|connection|timeout|dns|socket|urlerror|requests", re.IGNORECASE)
+
+# Gaps between playback polls while waiting for a new track to start (seconds)
+_TRACK_CHANGE_POLL_DELAYS = (0.1, 0.15, 0.25, 0.4, 0.6, 1.0)
+
+# Gaps between playback polls while checking that a pause took effect (seconds, ~0.5s in total)
+_STOP_POLL_DELAYS = (0.05, 0.1, 0.15, 0.2)
+
+# Longest Retry-After (seconds) we are willing to sleep through on a 429
+_MAX_RETRY_AFTER = 10.0
+
+# Backoff (seconds, doubling per attempt, capped at 60s) for a 429 that carries no Retry-After
+_RATE_LIMIT_BASE_DELAY = 0.5
+
+# Parsed config, reused until the file's mtime or size changes
+_config_cache = {'stamp': None, 'data': None}
+
+# Playback monitor runs are queued onto one long-lived daemon thread shared by all
+# backend instances, instead of spawning a new thread on every _start_monitoring()
+_monitor_jobs: 'queue.Queue' = queue.Queue()
+_monitor_worker: Optional[threading.Thread] = None
+_monitor_worker_lock = threading.Lock()
+
+
+def _import_spotipy() -> bool:
+    """Import spotipy and its HTTP stack on first use. Returns False if not installed."""
+    global spotipy, SpotifyOAuth, SpotifyException, requests, HTTPAdapter, Retry
+    if spotipy is not None:
+        return True
+    try:
+        import spotipy as _spotipy
+        from spotipy.oauth2 import SpotifyOAuth as _SpotifyOAuth
+        from spotipy.exceptions import SpotifyException as _SpotifyException
+        import requests as _requests
+        from requests.adapters import HTTPAdapter as _HTTPAdapter
+        from urllib3.util.retry import Retry as _Retry
+    except ImportError:
+        return False
+    SpotifyOAuth, SpotifyException = _SpotifyOAuth, _SpotifyException
+    requests, HTTPAdapter, Retry = _requests, _HTTPAdapter, _Retry
+    spotipy = _spotipy
+    return True
+
+
+def _import_dbus() -> bool:
+    """Import dbus-python on first use. Returns False if not installed."""
+    global dbus, _dbus_import_failed
+    if dbus is not None:
+        return True
+    if _dbus_import_failed:
+        return False
+    try:
+        import dbus as _dbus
+    except ImportError:
+        _dbus_import_failed = True
+        return False
+    dbus = _dbus
+    return True
+
+
+def _read_proc_comm(pid) -> Optional[str]:
+    """Read a process's command name from /proc, or None if it has exited."""
+    try:
+        with open(f'/proc/{pid}/comm', 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _build_http_session() -> 'requests.Session':
+    """Create a keep-alive HTTP session for Web API calls with retries on transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        # 429s are left to _with_retry/_spotify_call, which cap how long a caller waits -
+        # urllib3 would sleep through any Retry-After the server sends, however long.
+        # Once the 5xx retries are used up the last response is returned rather than
+        # raised: spotipy would otherwise report the RetryError as a 429 'Max Retries',
+        # and an outage would be treated as rate limiting instead of tripping the breaker
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+def _retry_after_seconds(e, attempt: int = 0) -> float:
+    """
+    Get how long to back off after a 429.
+    
+    Args:
+        e: SpotifyException with http_status 429
+        attempt: Number of 429s already retried for this request
+        
+    Returns:
+        The server's Retry-After, or an exponential backoff if it sent none
+    """
+    headers = getattr(e, 'headers', None) or {}
+    try:
+        return float(headers['Retry-After'])
+    except (KeyError, TypeError, ValueError):
+        return min(60.0, _RATE_LIMIT_BASE_DELAY * (1 << attempt))
+
+
+def _with_retry(fn, *args, max_429_retries=2, **kwargs):
+    """
+    Call a Web API method, waiting out 429 rate limits before giving up.
+    
+    The HTTP adapter only retries server errors, so every 429 surfaces here. It is
+    retried after the server's Retry-After delay, unless it asks for a wait longer
+    than _MAX_RETRY_AFTER (a user pressing a button won't wait that long).
+    
+    Args:
+        fn: Bound spotipy method to call
+        *args: Positional arguments for fn
+        max_429_retries: How many times to retry after a 429
+        **kwargs: Keyword arguments for fn
+        
+    Returns:
+        Whatever fn returns
+        
+    Raises:
+        spotipy.exceptions.SpotifyException: If the call fails with another status,
+            or is still rate limited after max_429_retries retries
+    """
+    for attempt in range(max_429_retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except SpotifyException as e:
+            if e.http_status != 429 or attempt >= max_429_retries:
+                raise
+            retry_after = _retry_after_seconds(e, attempt)
+            if retry_after > _MAX_RETRY_AFTER:
+                raise
+            logger.warning("Spotify rate limit hit, retrying in %.0fs", retry_after)
+            time.sleep(retry_after)
+
+
+def _spotify_call(method):
+    """
+    Decorate a backend method that calls the Web API so a 401 is recovered from once.
+    
+    On 401 Unauthorized the access token is refreshed and the whole method runs again,
+    so it must look up self._spotify at call time rather than hold on to the old client.
+    Short rate limits are waited out per request by _with_retry. A 429 that still gets
+    through blocks further calls until its Retry-After has passed - they fail straight
+    away with a 429 instead of spending requests that would be throttled anyway.
+    
+    Works as a circuit breaker too: after several network errors or 5xx responses in a
+    row, calls fail straight away for a while (no UI call waits on the HTTP timeouts of
+    an unreachable API). Once that time is up the circuit is half-open: one call is let
+    through to see if the API is back, and calls made while it is in flight still fail
+    straight away. Any answer from the API closes the circuit again.
+    
+    Args:
+        method: SpotifyBackend method to wrap
+        
+    Returns:
+        The wrapped method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        now = time.monotonic()
+        remaining = self._rate_limited_until - now
+        if remaining > 0:
+            raise SpotifyException(
+                429, -1, f"Rate limited by Spotify for another {remaining:.0f}s",
+                headers={'Retry-After': str(int(remaining) + 1)}
+            )
+        probing = False
+        if self._web_api_open_until:
+            if now < self._web_api_open_until:
+                raise requests.ConnectionError(
+                    f"Spotify Web API unreachable - skipping calls for another {self._web_api_open_until - now:.0f}s"
+                )
+            if not self._web_api_probe_lock.acquire(blocking=False):
+                raise requests.ConnectionError("Spotify Web API unreachable - waiting on a trial call")
+            probing = True
+        
+        try:
+            try:
+                result = method(self, *args, **kwargs)
+            except SpotifyException as e:
+                if e.http_status != 401 or self._refreshing_token:
+                    raise  # (a 401 while refreshing comes from the refresh itself - don't recurse)
+                logger.debug("Received 401 Unauthorized in %s - attempting token refresh...", method.__name__)
+                self._refreshing_token = True
+                try:
+                    self._refresh_token_in_place()
+                finally:
+                    self._refreshing_token = False
+                result = method(self, *args, **kwargs)
+        except SpotifyException as e:
+            if (e.http_status or 0) >= 500:
+                self._record_web_api_failure()
+            else:
+                # The API answered
+                self._web_api_failures = 0
+                self._web_api_open_until = 0.0
+                if e.http_status == 429:
+                    retry_after = _retry_after_seconds(e)
+                    self._rate_limited_until = time.monotonic() + retry_after
+                    logger.warning("Spotify rate limit in effect - holding off Web API calls for %.0fs", retry_after)
+            raise
+        except requests.RequestException:
+            self._record_web_api_failure()
+            raise
+        finally:
+            if probing:
+                self._web_api_probe_lock.release()
+        self._web_api_failures = 0
+        self._web_api_open_until = 0.0
+        return result
+    return wrapper
+
+
+def _run_monitor_jobs():
+    """Body of the shared monitor thread: run queued monitor jobs one after another."""
+    while True:
+        fn, future = _monitor_jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def _submit_monitor_job(fn) -> concurrent.futures.Future:
+    """Queue fn on the shared monitor thread, starting the thread on first use."""
+    global _monitor_worker
+    with _monitor_worker_lock:
+        if _monitor_worker is None:
+            _monitor_worker = threading.Thread(target=_run_monitor_jobs, name='spotify-mon', daemon=True)
+            _monitor_worker.start()
+    future = concurrent.futures.Future()
+    _monitor_jobs.put((fn, future))
+    return future
+
+
+def _atomic_write_json(path: Path, obj):
+    """
+    Write JSON to a temp file and rename it over path, so a crash never leaves a partial file.
+    
+    The temp file gets path's permissions (0600 for a new file - it holds OAuth tokens)
+    and is synced to disk before the rename, so a power cut can't leave an empty file.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o600
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)  # A leftover temp file keeps its old mode, and O_CREAT's mode is masked by the umask
+        with os.fdopen(fd, 'w') as f:
+            fd = None
+            f.write(json.dumps(obj))
+            f.flush()
+            os.fsync(f.fileno())
+    finally:
+        if fd is not None:
+            os.close(fd)
+    os.replace(tmp, path)
+
 
 class SpotifyBackend(BaseBackend):
     """Spotify playback backend using raspotify and Spotify Web API."""
@@ -51,36 +341,113 @@ class SpotifyBackend(BaseBackend):
         self._spotify: Optional[spotipy.Spotify] = None
         self._device_id: Optional[str] = None
         self._current_playlist_id: Optional[str] = None
-        self._is_paused = False
-        self._last_device_check = 0
+        self._current_track_id: Optional[str] = None  # Spotify ID of the track last seen playing
+        self._playback_cache: tuple[Optional[dict], float] = (None, 0.0)  # (current_playback() payload, monotonic timestamp)
+        self._playback_ttl = 1.0  # Reuse playback state for 1 second across is_playing/current item/stop
+        self._rate_limited_until = 0.0  # Monotonic time before which Web API calls are not attempted (after a 429)
+        self._web_api_failures = 0  # Consecutive network errors/5xx responses from the Web API
+        self._web_api_failure_threshold = 5  # Stop calling the Web API after this many failures in a row
+        self._web_api_reset_after = 30.0  # Seconds to fail fast before letting one call through again
+        self._web_api_open_until = 0.0  # Monotonic time before which Web API calls fail fast (0 while closed)
+        self._web_api_probe_lock = threading.Lock()  # Held by the one trial call let through a half-open circuit
+        self._refreshing_token = False  # Set while _spotify_call refreshes the token after a 401
+        self._is_playing_cache: tuple[float, bool] = (0.0, False)  # (monotonic timestamp, is_playing() result)
+        self._is_playing_ttl = 0.75  # Share is_playing() results between callers for 750ms
+        self._state_changed_at = 0.0  # Monotonic time of our last play()/resume()/stop()
+        self._own_state_ttl = 2.0  # Trust the state we just set for this long instead of asking Spotify
+        self._is_playing_lock = threading.Lock()  # Held by the thread currently refreshing is_playing()
+        self._mpris_snapshot_cache: tuple[float, Optional[dict]] = (0.0, None)  # (monotonic timestamp, Player properties)
+        self._mpris_snapshot_ttl = 0.5  # Reuse MPRIS player properties for 500ms
+        # Sources asked by is_playing(), in order; each returns None when it can't answer.
+        # The local MPRIS player is asked first while it is healthy - it's one IPC call
+        # instead of an HTTPS request counted against the Web API rate limit
+        self._playing_probes = (self._probe_web_api_playing, self._probe_mpris_playing)
+        self._playing_probes_mpris_first = (self._probe_mpris_playing, self._probe_web_api_playing)
+        self._prefer_mpris = True  # Cleared when there is no MPRIS player or it keeps failing
+        self._mpris_failures = 0  # Consecutive failed MPRIS status reads
+        self._max_mpris_failures = 3  # Go back to Web API first after this many failures
+        self._last_mpris_playing_ts = 0.0  # time.monotonic() of the last MPRIS 'Playing' answer
+        self._paused_event = threading.Event()  # Set while paused by us or reported paused; read by the monitor thread
+        self._pause_requested = False  # Whether the pause came from pause() (not just reported by a probe)
+        self._last_device_check = 0  # time.monotonic() of last device lookup
         self._device_check_interval = 30  # Check for device every 30 seconds
+        self._device_check_interval_ok = 300  # Check every 5 minutes once the device is verified active
+        self._device_verified = False  # Set when the device was confirmed active, cleared on Spotify errors
+        self._devices_cache: tuple[float, Optional[dict]] = (0.0, None)  # (monotonic timestamp, devices() payload)
         self._mpris_player = None  # MPRIS player object for fallback control
+        self._mpris_props = None  # Properties interface of the same MPRIS object
+        self._mpris_probed_at: Optional[float] = None  # time.monotonic() of the last D-Bus search for an MPRIS player
+        self._mpris_reprobe_interval = 30.0  # Search D-Bus again this often while no player was found
+        self._spotify_verified = False  # Whether authentication was verified with an API call
+        self._mpris_service_name: Optional[str] = None  # Bus name of the last MPRIS player found
+        self._track_count_cache: dict[str, tuple[int, float]] = {}  # uri -> (track count, monotonic timestamp)
+        self._track_count_ttl = 3600  # Playlists change rarely - re-fetch counts hourly (albums never change)
+        self._track_count_cache_size = 128  # Oldest entries are dropped beyond this many URIs
+        self._count_handlers = {  # URI type -> track count lookup (a single track is always 1)
+            'track': lambda _id: 1,
+            'playlist': self._playlist_track_count,
+            'album': self._album_track_count,
+        }
+        self._config: Optional[dict] = None  # Parsed spotify_api_config.json (set by _load_config)
+        self._configured_device_name_lower: Optional[str] = None  # Lowercased device_name from config
+        self._system_bus = None  # System bus connection for systemd queries
+        self._systemd_manager = None  # systemd Manager interface (avoids forking systemctl)
+        self._raspotify_unit_props = None  # Cached Properties interface of the raspotify unit object
+        self._raspotify_status_cache: tuple[float, bool] = (0.0, False)  # (monotonic timestamp, is_running)
+        self._raspotify_status_ttl = 1.0  # Reuse raspotify check results for 1s (play() starts fresh)
+        self._librespot_pid: Optional[int] = None  # Last librespot pid found in /proc
         self._device_activation_attempts = 0
         self._max_activation_attempts = 5  # Max attempts to activate device
         self._activation_retry_delay = 2.0  # Initial delay between activation attempts
+        self._activation_delays = tuple(  # Exponential backoff schedule, one entry per attempt
+            self._activation_retry_delay * (1 << i) for i in range(self._max_activation_attempts)
+        )
+        self._shutdown_event = threading.Event()  # Set by stop() to cut activation retry waits short
         self._monitoring_active = False
-        self._monitoring_thread: Optional[threading.Thread] = None
-        self._was_playing = False  # Track previous playing state to detect natural end
+        self._monitoring_future: Optional[concurrent.futures.Future] = None  # Current run on the shared monitor thread
+        self._monitor_generation = 0  # Bumped on every start/stop; a run only acts while its generation is current
+        self._monitor_stop_event = threading.Event()  # Stop event of the current monitor run (a new one per run)
+        self._monitor_min_interval = 2.0  # Shortest gap between monitor polls (seconds)
+        self._monitor_max_interval = 30.0  # Longest gap between monitor polls mid-track (seconds)
+        self._track_end_margin = 1.5  # Stopped this close to a track's end counts as reaching it (seconds)
+        self._required_stopped_checks = 3  # Consecutive stopped checks that confirm a playlist ended
+        self._required_end_checks = 2  # ...or this many when playback stopped right at the end of a track
+        self._http_session = None  # Pooled requests.Session shared by every Spotify client we build
         self._auth_manager: Optional[SpotifyOAuth] = None  # Store auth manager for proactive refresh
         self._token_refresh_thread: Optional[threading.Thread] = None
         self._token_refresh_active = False
         self._last_token_refresh = 0
+        # Worker threads for Web API calls that can overlap with device lookup (created on first play)
+        self._io_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
         self._token_refresh_interval = 3 * 24 * 3600  # Refresh every 3 days (tokens expire after ~60 days of inactivity, so 3 days provides good safety margin)
         
-        if not SPOTIPY_AVAILABLE:
+        if not _import_spotipy():
             raise BackendError("spotipy is not installed. Install it with: pip3 install --user --break-system-packages spotipy")
         
-        self._init_spotify()
-        self._init_mpris()
+        # Authentication is verified and MPRIS is probed on first use, keeping construction off the network
+        self._init_spotify(verify=False)
+        self._init_systemd()
         self._start_token_refresh_thread()
     
     def _load_config(self) -> dict:
-        """Load Spotify API configuration from file."""
-        if not CONFIG_FILE.exists():
+        """Load Spotify API configuration from file (cached until the file changes)."""
+        try:
+            st = os.stat(CONFIG_FILE)
+        except FileNotFoundError:
             raise BackendError(
                 f"Spotify API config not found at {CONFIG_FILE}. "
                 "Run spotify_oauth_setup.py to set up authentication."
             )
+        except OSError as e:
+            # e.g. permission denied - the same error the open() below would give
+            raise BackendError(f"Error loading config: {e}")
+        
+        # Size as well as mtime: coarse mtime resolution can hide a quick re-save
+        stamp = (st.st_mtime_ns, st.st_size)
+        if _config_cache['data'] is not None and _config_cache['stamp'] == stamp:
+            if self._config is not _config_cache['data']:
+                self._store_config(_config_cache['data'])
+            return self._config
         
         try:
             with open(CONFIG_FILE, 'r') as f:
@@ -91,8 +458,11 @@ class SpotifyBackend(BaseBackend):
             if missing:
                 raise BackendError(f"Missing required config keys: {missing}")
             
+            _config_cache['stamp'] = stamp
+            _config_cache['data'] = config
+            
             # Store config for device lookup
-            self._config = config
+            self._store_config(config)
             
             return config
         except json.JSONDecodeError as e:
@@ -100,20 +470,32 @@ class SpotifyBackend(BaseBackend):
         except Exception as e:
             raise BackendError(f"Error loading config: {e}")
     
-    def _init_spotify(self):
-        """Initialize Spotify client with OAuth."""
+    def _store_config(self, config: dict):
+        """Store loaded config along with values derived from it for device lookup."""
+        self._config = config
+        self._configured_device_name_lower = (config.get('device_name') or '').lower() or None
+    
+    def _init_spotify(self, verify: bool = True):
+        """
+        Initialize Spotify client with OAuth.
+        
+        Args:
+            verify: If True, verify authentication with an API call right away
+        """
         try:
             config = self._load_config()  # This already stores config in self._config
             
             cache_path = CACHE_DIR / ".spotify_cache"
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create OAuth manager
+            # Create OAuth manager; refreshed access tokens are written back to the cache
+            # file, so a restart reuses a still-valid token instead of refreshing again
             auth_manager = SpotifyOAuth(
                 client_id=config['client_id'],
                 client_secret=config['client_secret'],
                 redirect_uri=config.get('redirect_uri', 'http://127.0.0.1:8888/callback'),
                 scope=config.get('scope', 'user-read-playback-state user-modify-playback-state user-read-currently-playing'),
-                cache_path=str(cache_path)
+                cache_handler=spotipy.cache_handler.CacheFileHandler(cache_path=str(cache_path))
             )
             
             # Store auth manager for proactive token refresh
@@ -122,54 +504,111 @@ class SpotifyBackend(BaseBackend):
             # Ensure cache file has the refresh token from config
             # This handles cases where cache is missing or has stale data
             cached_token = auth_manager.get_cached_token()
-            if not cached_token or 'refresh_token' not in cached_token:
+            # Compare without surrounding whitespace, which hand-edited configs often pick up -
+            # otherwise every init would rewrite an identical token to the SD card
+            config_refresh_token = (config.get('refresh_token') or '').strip()
+            if cached_token and (cached_token.get('refresh_token') or '').strip() == config_refresh_token:
+                # Cache is already up to date - nothing to write
+                pass
+            elif not cached_token or 'refresh_token' not in cached_token:
                 # Cache doesn't have refresh token, initialize it from config
-                if 'refresh_token' in config:
+                if config_refresh_token:
                     token_data = {
-                        'refresh_token': config['refresh_token'],
+                        'refresh_token': config_refresh_token,
                         'scope': config.get('scope', 'user-read-playback-state user-modify-playback-state user-read-currently-playing')
                     }
                     # Write to cache file so spotipy can use it
-                    cache_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(cache_path, 'w') as f:
-                        json.dump(token_data, f)
+                    _atomic_write_json(cache_path, token_data)
                     logger.info("Initialized cache file with refresh token from config")
-            elif cached_token.get('refresh_token') != config.get('refresh_token'):
+            else:
                 # Cache has different refresh token, update it
-                cached_token['refresh_token'] = config['refresh_token']
-                with open(cache_path, 'w') as f:
-                    json.dump(cached_token, f)
+                cached_token['refresh_token'] = config_refresh_token
+                _atomic_write_json(cache_path, cached_token)
                 logger.info("Updated cache file with refresh token from config")
             
-            # Create Spotify client
-            self._spotify = spotipy.Spotify(auth_manager=auth_manager)
+            # Create Spotify client on the shared HTTP session so connections survive re-initialisation
+            if self._http_session is None:
+                self._http_session = _build_http_session()
+            self._spotify = spotipy.Spotify(auth_manager=auth_manager, requests_session=self._http_session)
             
-            # Test authentication by making a simple API call
-            try:
-                self._spotify.current_user()
-                logger.info("Initialized Spotify Web API client - authentication verified")
-                self._last_token_refresh = time.time()
-            except Exception as auth_error:
-                error_str = str(auth_error).lower()
-                # Check if refresh token has expired
-                if 'invalid_grant' in error_str or 'refresh_token' in error_str and ('expired' in error_str or 'invalid' in error_str):
-                    logger.error(
-                        "Refresh token has expired. You need to re-authenticate:\n"
-                        f"  Run: python3 {Path(__file__).parent.parent / 'scripts' / 'spotify_oauth_setup.py'}\n"
-                        "This will generate a new refresh token. Refresh tokens expire after ~60 days of inactivity."
-                    )
-                    raise BackendError("Spotify refresh token has expired. Please run spotify_oauth_setup.py to re-authenticate.")
-                else:
-                    logger.warning(f"Authentication test failed: {auth_error}. Token may need refresh.")
-                    # The auth_manager should handle refresh automatically on next API call
+            self._spotify_verified = False
+            if verify:
+                self._verify_spotify_auth()
                 
         except Exception as e:
             logger.error(f"Failed to initialize Spotify client: {e}")
             raise BackendError(f"Failed to initialize Spotify client: {e}")
     
+    def _refresh_token_in_place(self):
+        """
+        Refresh the access token after a 401 without rebuilding the Spotify client.
+        
+        The client asks the auth manager for its token on every request, so refreshing
+        through the auth manager (which writes the new token to the cache) is enough -
+        the pooled HTTP session and bound client methods are kept. Falls back to a full
+        _init_spotify() when there is no cached refresh token to use, or the refresh
+        fails (re-reading the config picks up a refresh token re-issued by the setup script).
+        
+        Raises:
+            BackendError: If the fallback re-initialization fails
+        """
+        cached_token = self._auth_manager.get_cached_token() if self._auth_manager else None
+        if not self._spotify or not cached_token or 'refresh_token' not in cached_token:
+            self._init_spotify()
+            return
+        
+        try:
+            self._auth_manager.refresh_access_token(cached_token['refresh_token'])
+        except Exception as e:
+            logger.warning(f"In-place token refresh failed ({e}), re-initializing Spotify client")
+            self._init_spotify()
+            return
+        logger.debug("Refreshed Spotify access token in place")
+    
+    def _verify_spotify_auth(self):
+        """
+        Test authentication by making a simple API call.
+        
+        Raises:
+            BackendError: If the refresh token has expired
+        """
+        try:
+            self._api_call('current_user')
+            logger.info("Initialized Spotify Web API client - authentication verified")
+            self._last_token_refresh = time.time()
+            self._spotify_verified = True
+        except Exception as auth_error:
+            error_str = str(auth_error).lower()
+            # Check if refresh token has expired
+            if 'invalid_grant' in error_str or 'refresh_token' in error_str and ('expired' in error_str or 'invalid' in error_str):
+                logger.error(
+                    "Refresh token has expired. You need to re-authenticate:\n"
+                    f"  Run: python3 {Path(__file__).parent.parent / 'scripts' / 'spotify_oauth_setup.py'}\n"
+                    "This will generate a new refresh token. Refresh tokens expire after ~60 days of inactivity."
+                )
+                raise BackendError("Spotify refresh token has expired. Please run spotify_oauth_setup.py to re-authenticate.")
+            else:
+                logger.warning(f"Authentication test failed: {auth_error}. Token may need refresh.")
+                # The auth_manager should handle refresh automatically on next API call
+    
+    def _get_io_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the worker pool for overlapping Web API calls, creating it on first use."""
+        if self._io_pool is None:
+            self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='spotify-io')
+        return self._io_pool
+    
+    def _get_mpris(self):
+        """Get the MPRIS player, probing D-Bus for it on first use and every 30s while there is none."""
+        if self._mpris_player is None:
+            now = time.monotonic()
+            if self._mpris_probed_at is None or now - self._mpris_probed_at >= self._mpris_reprobe_interval:
+                self._mpris_probed_at = now
+                self._init_mpris()
+        return self._mpris_player
+    
     def _init_mpris(self):
         """Initialize MPRIS interface for fallback control."""
-        if not DBUS_AVAILABLE:
+        if not _import_dbus():
             logger.debug("D-Bus not available, MPRIS fallback disabled")
             return
         
@@ -183,10 +622,24 @@ class SpotifyBackend(BaseBackend):
                 'org.mpris.MediaPlayer2.spotifyd'
             ]
             
-            for service_name in service_names:
+            # List bus names once and only connect to a player that is actually registered
+            # (names may carry an instance suffix, e.g. org.mpris.MediaPlayer2.librespot.instance123)
+            registered = [str(name) for name in bus.list_names()]
+            candidates = [
+                name for prefix in service_names for name in registered
+                if name == prefix or name.startswith(prefix + '.')
+            ]
+            # Prefer the name found last time (cheap reinit after raspotify restarts)
+            if self._mpris_service_name in candidates:
+                candidates.remove(self._mpris_service_name)
+                candidates.insert(0, self._mpris_service_name)
+            
+            for service_name in candidates:
                 try:
                     proxy = bus.get_object(service_name, '/org/mpris/MediaPlayer2')
                     self._mpris_player = dbus.Interface(proxy, 'org.mpris.MediaPlayer2.Player')
+                    self._mpris_props = dbus.Interface(proxy, 'org.freedesktop.DBus.Properties')
+                    self._mpris_service_name = service_name
                     logger.info(f"MPRIS interface initialized: {service_name}")
                     return
                 except dbus.exceptions.DBusException:
@@ -194,7 +647,61 @@ class SpotifyBackend(BaseBackend):
             
             logger.debug("MPRIS interface not found (raspotify may not be running or MPRIS not enabled)")
         except Exception as e:
-            logger.debug(f"Could not initialize MPRIS: {e}")
+            logger.debug("Could not initialize MPRIS: %s", e)
+    
+    def _reset_mpris(self):
+        """Forget the MPRIS player so the next _get_mpris() searches D-Bus for it again."""
+        self._mpris_player = None
+        self._mpris_props = None
+        self._mpris_probed_at = None
+        self._mpris_snapshot_cache = (0.0, None)
+    
+    def _init_systemd(self):
+        """Initialize systemd D-Bus interface for checking raspotify without spawning systemctl."""
+        if not _import_dbus():
+            logger.debug("D-Bus not available, raspotify checks will use systemctl")
+            return
+        
+        try:
+            # raspotify is a system service, so its unit lives on the system bus
+            self._system_bus = dbus.SystemBus()
+            proxy = self._system_bus.get_object('org.freedesktop.systemd1', '/org/freedesktop/systemd1')
+            self._systemd_manager = dbus.Interface(proxy, 'org.freedesktop.systemd1.Manager')
+            logger.debug("systemd D-Bus interface initialized")
+        except Exception as e:
+            logger.debug("Could not initialize systemd D-Bus interface: %s", e)
+            self._system_bus = None
+            self._systemd_manager = None
+    
+    def _get_raspotify_active_state(self) -> Optional[str]:
+        """
+        Get the ActiveState of the raspotify unit over D-Bus.
+        
+        Returns:
+            ActiveState string (e.g. 'active', 'inactive'), or None if D-Bus could not answer
+        """
+        if not self._systemd_manager:
+            return None
+        
+        try:
+            if self._raspotify_unit_props is None:
+                unit_path = self._systemd_manager.GetUnit(RASPOTIFY_UNIT)
+                # No introspection: we only ever call Properties.Get on it
+                unit = self._system_bus.get_object('org.freedesktop.systemd1', unit_path, introspect=False)
+                self._raspotify_unit_props = dbus.Interface(unit, 'org.freedesktop.DBus.Properties')
+            return str(self._raspotify_unit_props.Get('org.freedesktop.systemd1.Unit', 'ActiveState'))
+        except dbus.exceptions.DBusException as e:
+            # Unit may have been unloaded - look it up again next time
+            self._raspotify_unit_props = None
+            if e.get_dbus_name() == 'org.freedesktop.systemd1.NoSuchUnit':
+                # systemd only unloads units that are not running
+                return 'inactive'
+            logger.debug("systemd D-Bus query failed: %s", e)
+            return None
+        except Exception as e:
+            self._raspotify_unit_props = None
+            logger.debug("systemd D-Bus query failed: %s", e)
+            return None
     
     def _start_token_refresh_thread(self):
         """Start background thread for proactive token refresh."""
@@ -229,7 +736,7 @@ class SpotifyBackend(BaseBackend):
                                     try:
                                         # Make a simple API call which will trigger refresh if needed
                                         if self._spotify:
-                                            self._spotify.current_user()
+                                            self._api_call('current_user')
                                             self._last_token_refresh = time.time()
                                             logger.info("Successfully refreshed Spotify token")
                                         else:
@@ -271,50 +778,150 @@ class SpotifyBackend(BaseBackend):
                 logger.info("Stopping token refresh thread")
     
     def _check_raspotify_running(self) -> bool:
-        """Check if raspotify service is running."""
-        # Try systemctl first (most reliable if available)
-        try:
-            result = subprocess.run(
-                ['systemctl', 'is-active', '--quiet', 'raspotify'],
-                timeout=2,
-                capture_output=True,
-                check=False  # Don't raise on non-zero exit
-            )
-            if result.returncode == 0:
-                logger.debug("raspotify is running (checked via systemctl)")
-                return True
-            else:
-                logger.debug(f"systemctl check returned code {result.returncode}")
-        except subprocess.TimeoutExpired:
-            logger.debug("systemctl check timed out")
-        except FileNotFoundError:
-            logger.debug("systemctl not found, trying pgrep")
-        except Exception as e:
-            logger.debug(f"systemctl check failed: {e}")
+        """Check if raspotify service is running (result is reused for a short TTL)."""
+        checked_at, is_running = self._raspotify_status_cache
+        if time.monotonic() - checked_at < self._raspotify_status_ttl:
+            return is_running
+        
+        is_running = self._probe_raspotify_running()
+        self._raspotify_status_cache = (time.monotonic(), is_running)
+        return is_running
+    
+    def _invalidate_raspotify_status(self):
+        """Force the next raspotify check to query the system again."""
+        self._raspotify_status_cache = (0.0, False)
+    
+    def _probe_raspotify_running(self) -> bool:
+        """Query the system for whether raspotify is running (uncached)."""
+        # Ask systemd over D-Bus first (no process creation)
+        active_state = self._get_raspotify_active_state()
+        if active_state == 'active':
+            logger.debug("raspotify is running (checked via D-Bus)")
+            return True
+        elif active_state is not None:
+            logger.debug("systemd reports raspotify as %s", active_state)
+        else:
+            # D-Bus unavailable - fall back to systemctl
+            try:
+                result = subprocess.run(
+                    [_SYSTEMCTL, 'is-active', '--quiet', 'raspotify'],
+                    timeout=2,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=_SUBPROCESS_ENV,
+                    check=False  # Don't raise on non-zero exit
+                )
+                if result.returncode == 0:
+                    logger.debug("raspotify is running (checked via systemctl)")
+                    return True
+                else:
+                    logger.debug("systemctl check returned code %s", result.returncode)
+            except subprocess.TimeoutExpired:
+                logger.debug("systemctl check timed out")
+            except FileNotFoundError:
+                logger.debug("systemctl not found, trying pgrep")
+            except Exception as e:
+                logger.debug("systemctl check failed: %s", e)
         
         # Fallback: check if librespot process is running
         try:
-            result = subprocess.run(
-                ['pgrep', '-f', 'librespot'],
-                timeout=2,
-                capture_output=True,
-                check=False  # Don't raise on non-zero exit
-            )
-            if result.returncode == 0:
-                logger.debug("raspotify is running (checked via pgrep)")
+            pid = self._librespot_pid_from_proc()
+            if pid is not None:
+                logger.debug("raspotify is running (found librespot pid %s in /proc)", pid)
                 return True
             else:
-                logger.debug("pgrep did not find librespot process")
-        except subprocess.TimeoutExpired:
-            logger.debug("pgrep check timed out")
-        except FileNotFoundError:
-            logger.debug("pgrep not found")
-        except Exception as e:
-            logger.debug(f"pgrep check failed: {e}")
+                logger.debug("No librespot process found in /proc")
+        except OSError as e:
+            # /proc not available - fall back to pgrep
+            logger.debug("Could not scan /proc: %s, trying pgrep", e)
+            try:
+                result = subprocess.run(
+                    [_PGREP, '-f', 'librespot'],
+                    timeout=2,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=_SUBPROCESS_ENV,
+                    check=False  # Don't raise on non-zero exit
+                )
+                if result.returncode == 0:
+                    logger.debug("raspotify is running (checked via pgrep)")
+                    return True
+                else:
+                    logger.debug("pgrep did not find librespot process")
+            except subprocess.TimeoutExpired:
+                logger.debug("pgrep check timed out")
+            except FileNotFoundError:
+                logger.debug("pgrep not found")
+            except Exception as e:
+                logger.debug("pgrep check failed: %s", e)
         
         logger.debug("raspotify check: not running")
         return False
     
+    def _librespot_pid_from_proc(self) -> Optional[int]:
+        """
+        Find a running librespot process by reading /proc/<pid>/comm (no subprocess).
+        
+        The last pid found is re-checked first, so /proc is only rescanned when it exits.
+        
+        Returns:
+            PID of the librespot process, or None if it is not running
+            
+        Raises:
+            OSError: If /proc cannot be read
+        """
+        if self._librespot_pid is not None:
+            if _read_proc_comm(self._librespot_pid) == 'librespot':
+                return self._librespot_pid
+            self._librespot_pid = None
+        
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if entry.name.isdigit() and _read_proc_comm(entry.name) == 'librespot':
+                    self._librespot_pid = int(entry.name)
+                    return self._librespot_pid
+        return None
+    
+    def _start_raspotify_unit(self) -> bool:
+        """
+        Start raspotify through the systemd D-Bus API.
+        
+        Returns:
+            True if systemd accepted the start job, False if D-Bus is unavailable or refused
+        """
+        if not self._systemd_manager:
+            return False
+        
+        try:
+            job_path = self._systemd_manager.StartUnit(RASPOTIFY_UNIT, 'replace')
+            logger.debug("Queued raspotify start job via D-Bus: %s", job_path)
+            return True
+        except Exception as e:
+            logger.debug("Could not start raspotify via D-Bus: %s", e)
+            return False
+    
+    def _wait_for_raspotify_running(self, timeout: float) -> Optional[float]:
+        """
+        Poll until raspotify is running, backing off exponentially from 100ms.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            Seconds waited until raspotify was running, or None if it did not start in time
+        """
+        start = time.monotonic()
+        delay = 0.1
+        while True:
+            elapsed = time.monotonic() - start
+            self._invalidate_raspotify_status()
+            if self._check_raspotify_running():
+                return elapsed
+            if elapsed >= timeout:
+                return None
+            time.sleep(min(delay, timeout - elapsed))
+            delay *= 2
+    
     def _start_raspotify_service(self) -> bool:
         """
         Attempt to start the raspotify service.
@@ -323,56 +930,52 @@ class SpotifyBackend(BaseBackend):
             True if service was started successfully, False otherwise
         """
         # First check if it's already running
+        self._invalidate_raspotify_status()
         is_running = self._check_raspotify_running()
         if is_running:
             logger.debug("raspotify is already running, no need to start it")
             return True
         
-        # Double-check with a small delay in case of timing issues
-        logger.debug("First check said not running, double-checking...")
-        time.sleep(0.2)
-        is_running = self._check_raspotify_running()
-        if is_running:
-            logger.info("raspotify is running (verified on second check)")
-            return True
-        
-        logger.debug("Both checks confirmed raspotify is not running")
+        # Races with a service that is just coming up are caught by the post-start polling below
+        logger.debug("raspotify is not running")
         
         try:
-            # Try systemctl without sudo first (works if user has polkit permissions)
-            # This is necessary because the service runs with NoNewPrivileges=true
             logger.info("Attempting to start raspotify service...")
             
-            # First try without sudo (works with polkit if configured)
-            result = subprocess.run(
-                ['systemctl', 'start', 'raspotify'],
-                timeout=10,
-                capture_output=True,
-                text=True
-            )
+            # Ask systemd directly over D-Bus first (works with polkit if configured)
+            started = self._start_raspotify_unit()
             
-            # If that fails, try with sudo as last resort (may fail due to NoNewPrivileges)
-            if result.returncode != 0:
-                logger.debug("System service start without sudo failed, trying with sudo...")
+            if not started:
+                # Try systemctl without sudo (works if user has polkit permissions)
+                # This is necessary because the service runs with NoNewPrivileges=true
                 result = subprocess.run(
-                    ['sudo', 'systemctl', 'start', 'raspotify'],
+                    [_SYSTEMCTL, 'start', 'raspotify'],
                     timeout=10,
                     capture_output=True,
                     text=True
                 )
+                
+                # If that fails, try with sudo as last resort (may fail due to NoNewPrivileges)
+                if result.returncode != 0:
+                    logger.debug("System service start without sudo failed, trying with sudo...")
+                    result = subprocess.run(
+                        ['sudo', 'systemctl', 'start', 'raspotify'],
+                        timeout=10,
+                        capture_output=True,
+                        text=True
+                    )
+                started = result.returncode == 0
             
-            if result.returncode == 0:
+            if started:
+                self._invalidate_raspotify_status()
+                # A fresh librespot registers a new MPRIS player - search for it again on next use
+                self._reset_mpris()
                 # Give the service time to start and register with Spotify
                 # Raspotify needs time to: start process, connect to Spotify, register as device
                 logger.info("Waiting for raspotify to start and register with Spotify API...")
-                for i in range(5):  # Wait up to 5 seconds, checking every second
-                    time.sleep(1)
-                    if self._check_raspotify_running():
-                        logger.info(f"Successfully started raspotify service (verified after {i+1}s)")
-                        return True
-                # Final check
-                if self._check_raspotify_running():
-                    logger.info("Successfully started raspotify service (verified after 5s)")
+                waited = self._wait_for_raspotify_running(timeout=5.0)
+                if waited is not None:
+                    logger.info(f"Successfully started raspotify service (verified after {waited:.1f}s)")
                     return True
                 else:
                     logger.warning("raspotify service start command succeeded but service is not active after 5s")
@@ -386,15 +989,9 @@ class SpotifyBackend(BaseBackend):
                 
                 # Wait and check if service becomes available anyway
                 # Sometimes systemd starts services asynchronously or they're already starting
-                for i in range(8):  # Wait up to 8 seconds, checking every second
-                    time.sleep(1)
-                    if self._check_raspotify_running():
-                        logger.info(f"raspotify service is running (verified after {i+1}s, despite start command failure)")
-                        return True
-                
-                # Final check
-                if self._check_raspotify_running():
-                    logger.info("raspotify service is running (verified after 8s, despite start command failure)")
+                waited = self._wait_for_raspotify_running(timeout=8.0)
+                if waited is not None:
+                    logger.info(f"raspotify service is running (verified after {waited:.1f}s, despite start command failure)")
                     return True
                 
                 # Check for specific errors that indicate we can't start it
@@ -451,100 +1048,93 @@ class SpotifyBackend(BaseBackend):
                 return None
             
             # Check for manually configured device_id first
-            config = getattr(self, '_config', None)
-            if not config:
-                config = self._load_config()
-            configured_device_id = None
-            if config and config.get('device_id'):
-                device_id = config['device_id']
-                logger.info(f"Using manually configured device_id: {device_id}")
-                # Verify it's still available
-                try:
-                    devices = self._spotify.devices()
-                    device_list = devices.get('devices', [])
+            config = self._config or self._load_config()
+            configured_device_id = config.get('device_id') if config else None
+            if configured_device_id:
+                logger.info("Using manually configured device_id: %s", configured_device_id)
+            
+            first_attempt = True
+            while True:
+                # Retries must see what registered since the last look, not a cached list
+                devices = self._devices_cached() if first_attempt else self._devices_cached(max_age=0)
+                device_list = devices.get('devices', [])
+                
+                # Verify the configured device_id is available (on every attempt - it may register late)
+                if configured_device_id:
                     for device in device_list:
-                        if device.get('id') == device_id:
+                        if device.get('id') == configured_device_id:
                             is_active = device.get('is_active', False)
                             status = "ACTIVE" if is_active else "inactive"
-                            logger.info(f"Verified configured device: {device.get('name')} ({device_id}) - {status}")
+                            logger.info("Verified configured device: %s (%s) - %s", device.get('name'), configured_device_id, status)
                             if not is_active:
                                 logger.debug("Device is inactive - will need to transfer playback before starting")
-                            return device_id
-                    logger.warning(f"Configured device_id {device_id} not found in available devices - will search by name/keywords instead")
+                            self._device_activation_attempts = 0  # Reset on success
+                            return configured_device_id
+                    if first_attempt:
+                        logger.warning("Configured device_id %s not found in available devices - will search by name/keywords instead", configured_device_id)
                     # Don't return None here - continue to search by name/keywords
-                except Exception as e:
-                    logger.warning(f"Could not verify configured device_id: {e}")
-                    # Continue searching by name/keywords
-            
-            try:
-                devices = self._spotify.devices()
-            except spotipy.exceptions.SpotifyException as e:
-                if e.http_status == 401:
-                    logger.warning("Received 401 Unauthorized while finding device - attempting token refresh...")
-                    try:
-                        self._init_spotify()
-                        devices = self._spotify.devices()
-                    except Exception as refresh_error:
-                        logger.error(f"Failed to refresh token: {refresh_error}")
-                        return None
-                else:
-                    raise
-            
-            device_list = devices.get('devices', [])
-            
-            # Check for manually configured device_name
-            # Check this even if device_id was configured but not found (stale device_id)
-            if config.get('device_name'):
-                device_name_lower = config['device_name'].lower()
+                first_attempt = False
+                
+                # One pass over the list: a manually configured device_name wins (checked even if
+                # device_id was configured but not found), otherwise the first device whose name
+                # contains raspotify-related keywords
+                device_name_lower = self._configured_device_name_lower
+                keyword_match = None
                 for device in device_list:
-                    if device.get('name', '').lower() == device_name_lower:
-                        device_id = device.get('id')
-                        if device_id:
-                            logger.info(f"Found device by configured name '{config['device_name']}': {device_id}")
-                            return device_id
-            
-            # Look for device with name containing raspotify-related keywords
-            # Common names: "raspotify", "Raspberry Pi", "raspberry", "librespot", "Rodrigo's Radio", etc.
-            keywords = ['raspotify', 'raspberry', 'librespot', 'pi', "rodrigo's radio", 'rodrigo radio']
-            for device in device_list:
-                name = device.get('name', '').lower()
-                if any(keyword in name for keyword in keywords):
                     device_id = device.get('id')
-                    if device_id:
-                        logger.info(f"Found raspotify device: {device.get('name')} ({device_id})")
+                    if not device_id:
+                        continue
+                    name = device.get('name', '')
+                    if device_name_lower and name.lower() == device_name_lower:
+                        logger.info("Found device by configured name '%s': %s", config['device_name'], device_id)
                         self._device_activation_attempts = 0  # Reset on success
                         return device_id
-            
-            # Device not found - try to activate it if raspotify is running
-            if retry and self._check_raspotify_running():
-                if self._device_activation_attempts < self._max_activation_attempts:
-                    self._device_activation_attempts += 1
-                    delay = self._activation_retry_delay * (2 ** (self._device_activation_attempts - 1))
-                    logger.info(
-                        f"Raspotify device not found in API (attempt {self._device_activation_attempts}/{self._max_activation_attempts}). "
-                        f"Raspotify is running - waiting {delay:.1f}s for it to register with Spotify..."
-                    )
-                    play_retry_beep()
-                    time.sleep(delay)
-                    # Retry finding the device
-                    return self._find_raspotify_device(retry=True)
-                else:
+                    if keyword_match is None and _DEVICE_KEYWORD_RE.search(name):
+                        keyword_match = (name, device_id)
+                        if not device_name_lower:
+                            break  # Nothing better to look for
+                
+                if keyword_match:
+                    name, device_id = keyword_match
+                    logger.info("Found raspotify device: %s (%s)", name, device_id)
+                    self._device_activation_attempts = 0  # Reset on success
+                    return device_id
+                
+                # Device not found - wait for it to register if raspotify is running
+                if not retry or not self._check_raspotify_running():
+                    break
+                if self._device_activation_attempts >= self._max_activation_attempts:
                     logger.warning(
-                        f"Raspotify device not found after {self._max_activation_attempts} attempts. "
+                        "Raspotify device not found after %d attempts. "
                         "Raspotify is running but not appearing in Spotify API. "
-                        "This may require manual activation from Spotify app on first use."
+                        "This may require manual activation from Spotify app on first use.",
+                        self._max_activation_attempts
                     )
+                    break
+                
+                self._device_activation_attempts += 1
+                delay = self._activation_delays[self._device_activation_attempts - 1]
+                logger.info(
+                    "Raspotify device not found in API (attempt %d/%d). "
+                    "Raspotify is running - waiting %.1fs for it to register with Spotify...",
+                    self._device_activation_attempts, self._max_activation_attempts, delay
+                )
+                play_retry_beep()
+                if self._shutdown_event.wait(delay):
+                    logger.info("Device lookup interrupted by stop()")
+                    return None
             
             # If not found, log available devices at INFO level for debugging
             if device_list:
-                logger.info("Raspotify device not found. Available devices in Spotify API:")
-                for device in device_list:
-                    device_name = device.get('name', 'Unknown')
-                    device_id = device.get('id', 'Unknown')
-                    device_type = device.get('type', 'Unknown')
-                    is_active = device.get('is_active', False)
-                    status = "ACTIVE" if is_active else "inactive"
-                    logger.info(f"  - {device_name} ({device_type}) [{device_id}] - {status}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Raspotify device not found. Available devices in Spotify API:")
+                    for device in device_list:
+                        status = "ACTIVE" if device.get('is_active', False) else "inactive"
+                        logger.info(
+                            "  - %s (%s) [%s] - %s",
+                            device.get('name', 'Unknown'), device.get('type', 'Unknown'),
+                            device.get('id', 'Unknown'), status
+                        )
                 logger.info("Tip: If your device is listed above, you can configure it manually in spotify_api_config.json:")
                 logger.info("  Add 'device_id': '<device_id>' or 'device_name': '<device_name>' to the config file")
             else:
@@ -554,11 +1144,51 @@ class SpotifyBackend(BaseBackend):
                 logger.warning("  3. Connect to it (play something on it)")
                 logger.warning("  4. Once connected, it will appear in the API")
             
+            return None
+        except requests.ConnectionError:
+            raise  # Network down (or the Web API circuit open) - not a missing device
+        except SpotifyException as e:
+            if e.http_status == 429:
+                raise  # Rate limited - not a missing device
+            logger.error("Error finding raspotify device: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error finding raspotify device: {e}")
+            logger.error("Error finding raspotify device: %s", e)
             return None
     
+    def _devices_cached(self, max_age: float = 2.0) -> dict:
+        """
+        Get the Spotify devices list, reusing a recent response.
+        
+        Args:
+            max_age: Maximum age in seconds of a cached response to reuse
+            
+        Returns:
+            Payload of the Spotify devices() call
+        """
+        fetched_at, devices = self._devices_cache
+        if devices is not None and time.monotonic() - fetched_at < max_age:
+            return devices
+        
+        try:
+            devices = self._api_call('devices')
+        except SpotifyException:
+            self._invalidate_devices_cache()
+            raise
+        self._devices_cache = (time.monotonic(), devices)
+        return devices
+    
+    def _invalidate_devices_cache(self):
+        """Drop the cached devices list so the next lookup hits the API."""
+        self._devices_cache = (0.0, None)
+    
+    def _forget_device(self):
+        """Clear the current device so the next _ensure_device() looks it up again from a fresh list."""
+        self._device_id = None
+        self._last_device_check = 0
+        self._device_verified = False
+        self._invalidate_devices_cache()
+    
     def _ensure_device(self, retry: bool = True) -> bool:
         """
         Ensure we have a valid device ID, refreshing if needed.
@@ -573,11 +1203,19 @@ class SpotifyBackend(BaseBackend):
         Raises:
             BackendError: If device cannot be found and no fallback is available
         """
-        current_time = time.time()
+        current_time = time.monotonic()
+        check_interval = self._device_check_interval_ok if self._device_verified else self._device_check_interval
         
         # Check if we need to refresh device ID
-        if not self._device_id or (current_time - self._last_device_check) > self._device_check_interval:
-            self._device_id = self._find_raspotify_device(retry=retry)
+        if not self._device_id or (current_time - self._last_device_check) > check_interval:
+            self._device_verified = False
+            # The player state names the active device, which saves the devices() call when we are it
+            device_id = self._device_from_playback()
+            if device_id:
+                self._device_id = device_id
+                self._device_verified = True
+            else:
+                self._device_id = self._find_raspotify_device(retry=retry)
             self._last_device_check = current_time
         
         # Only check/start raspotify if we don't have a device yet
@@ -594,12 +1232,10 @@ class SpotifyBackend(BaseBackend):
                     # Start command failed, but wait a bit to see if service starts anyway
                     logger.info("raspotify start command failed, but checking if service becomes available...")
                     # Wait up to 5 seconds to see if service starts asynchronously
-                    for i in range(5):
-                        time.sleep(1)
-                        if self._check_raspotify_running():
-                            logger.info(f"raspotify is running (verified after {i+1}s, despite start command failure)")
-                            raspotify_was_started = True
-                            break
+                    waited = self._wait_for_raspotify_running(timeout=5.0)
+                    if waited is not None:
+                        logger.info(f"raspotify is running (verified after {waited:.1f}s, despite start command failure)")
+                        raspotify_was_started = True
                     
                     # Final check
                     if not self._check_raspotify_running():
@@ -628,7 +1264,7 @@ class SpotifyBackend(BaseBackend):
             # If still no device, check for MPRIS fallback
             if not self._device_id:
                 # If MPRIS is available, we can still control playback (but not start playlists)
-                if self._mpris_player:
+                if self._get_mpris():
                     logger.warning(
                         "Raspotify device not found in Spotify API, but MPRIS interface is available. "
                         "Basic controls (play/pause/next/previous) will work, but starting new playlists may fail. "
@@ -649,6 +1285,42 @@ class SpotifyBackend(BaseBackend):
         
         return True
     
+    def _device_from_playback(self) -> Optional[str]:
+        """
+        Get our device from the current playback state if it is the active device.
+        
+        Applies the same preference as _find_raspotify_device: a configured device_id,
+        else a configured device_name, else a raspotify-like name.
+        
+        Returns:
+            Device ID if the active device is ours, None otherwise
+        """
+        try:
+            playback = self._get_playback()
+        except Exception as e:
+            logger.debug("Could not get playback state for device lookup: %s", e)
+            return None
+        
+        device = (playback or {}).get('device') or {}
+        device_id = device.get('id')
+        if not device_id or not device.get('is_active', False):
+            return None
+        
+        name = device.get('name') or ''
+        configured_device_id = (self._config or {}).get('device_id')
+        if configured_device_id:
+            matched = device_id == configured_device_id
+        elif self._configured_device_name_lower:
+            matched = name.lower() == self._configured_device_name_lower
+        else:
+            matched = bool(_DEVICE_KEYWORD_RE.search(name))
+        if not matched:
+            return None
+        
+        logger.debug("Using active device from playback state: %s (%s)", name, device_id)
+        self._device_activation_attempts = 0
+        return device_id
+    
     def _ensure_device_active(self) -> bool:
         """
         Ensure the device is active (selected in Spotify).
@@ -660,9 +1332,18 @@ class SpotifyBackend(BaseBackend):
         if not self._device_id or not self._spotify:
             return False
         
+        # A fresh playback state that already shows our device active needs no devices() call
+        playback, fetched_at = self._playback_cache
+        if playback and fetched_at and time.monotonic() - fetched_at < self._playback_ttl:
+            device = playback.get('device') or {}
+            if device.get('id') == self._device_id and device.get('is_active', False):
+                logger.debug("Device %s is already active", self._device_id)
+                self._device_verified = True
+                return True
+        
         try:
             # Get current device list
-            devices = self._spotify.devices()
+            devices = self._devices_cached()
             device_list = devices.get('devices', [])
             
             # Find our device and check if it's active
@@ -670,23 +1351,27 @@ class SpotifyBackend(BaseBackend):
                 if device.get('id') == self._device_id:
                     is_active = device.get('is_active', False)
                     if is_active:
-                        logger.debug(f"Device {self._device_id} is already active")
+                        logger.debug("Device %s is already active", self._device_id)
+                        self._device_verified = True
                         return True
                     else:
                         # Device is inactive, transfer playback to it
                         logger.info(f"Device {self._device_id} is inactive, transferring playback to it...")
                         try:
-                            self._spotify.transfer_playback(device_id=self._device_id, force_play=False)
+                            self._invalidate_devices_cache()
+                            self._api_call('transfer_playback', device_id=self._device_id, force_play=False)
+                            self._invalidate_playback_cache()
                             # Give it a moment to transfer
                             time.sleep(0.5)
                             logger.info("Successfully transferred playback to device")
+                            self._device_verified = True
                             return True
-                        except spotipy.exceptions.SpotifyException as e:
+                        except SpotifyException as e:
+                            self._device_verified = False
                             if e.http_status == 404:
                                 logger.warning("Device not found when trying to transfer playback - device may have disconnected")
                                 # Force device refresh
-                                self._device_id = None
-                                self._last_device_check = 0
+                                self._forget_device()
                                 return False
                             else:
                                 logger.warning(f"Failed to transfer playback to device: {e}")
@@ -694,16 +1379,18 @@ class SpotifyBackend(BaseBackend):
             
             # Device not found in list - might have disconnected
             logger.warning(f"Device {self._device_id} not found in device list - device may have disconnected")
-            self._device_id = None
-            self._last_device_check = 0
+            self._forget_device()
             return False
             
         except Exception as e:
             logger.warning(f"Error checking/activating device: {e}")
+            self._device_verified = False
             return False
     
-    def _normalize_uri(self, source_id: str) -> str:
-        """Normalize source ID to full Spotify URI."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_uri(source_id: str) -> str:
+        """Normalize source ID to full Spotify URI (memoized; source IDs repeat constantly)."""
         if source_id.startswith('spotify:'):
             return source_id
         
@@ -717,7 +1404,32 @@ class SpotifyBackend(BaseBackend):
     
     def _get_track_count(self, uri: str) -> Optional[int]:
         """
-        Get the total number of tracks in a playlist or album.
+        Get the total number of tracks in a playlist or album, cached per URI.
+        
+        Args:
+            uri: Spotify URI (playlist, album, or track)
+            
+        Returns:
+            Number of tracks, or None if unable to determine
+        """
+        if uri.startswith('spotify:track:'):
+            return 1  # Nothing to look up
+        
+        cached = self._track_count_cache.get(uri)
+        if cached and (uri.startswith('spotify:album:') or time.monotonic() - cached[1] < self._track_count_ttl):
+            return cached[0]
+        
+        total = self._fetch_track_count(uri)
+        if total is not None:
+            self._track_count_cache.pop(uri, None)  # Re-insert as newest
+            self._track_count_cache[uri] = (total, time.monotonic())
+            if len(self._track_count_cache) > self._track_count_cache_size:
+                del self._track_count_cache[next(iter(self._track_count_cache))]
+        return total
+    
+    def _fetch_track_count(self, uri: str) -> Optional[int]:
+        """
+        Fetch the total number of tracks in a playlist or album from the Web API.
         
         Args:
             uri: Spotify URI (playlist, album, or track)
@@ -729,48 +1441,131 @@ class SpotifyBackend(BaseBackend):
             if not self._spotify:
                 return None
             
-            # Extract type and ID from URI
-            if not uri.startswith('spotify:'):
+            # Extract type and ID from URI ("spotify:<type>:<id>")
+            try:
+                scheme, uri_type, uri_id = uri.split(':', 2)
+            except ValueError:
                 return None
-            
-            parts = uri.split(':')
-            if len(parts) < 3:
+            if scheme != 'spotify':
+                return None
+            uri_id = uri_id.partition(':')[0]
+            if not uri_id:
                 return None
             
-            uri_type = parts[1]  # 'playlist', 'album', 'track'
-            uri_id = parts[2]
+            handler = self._count_handlers.get(uri_type)  # 'playlist', 'album', 'track'
+            return handler(uri_id) if handler else None
+        except Exception as e:
+            logger.debug("Error getting track count: %s", e)
+            return None
+    
+    def _playlist_track_count(self, playlist_id: str) -> Optional[int]:
+        """
+        Get the number of tracks in a playlist.
+        
+        Args:
+            playlist_id: Spotify playlist ID
             
-            if uri_type == 'track':
-                # Single track, return 1
-                return 1
-            elif uri_type == 'playlist':
-                # Get playlist tracks count
-                try:
-                    # Use playlist_tracks with limit=1 to get total count efficiently
-                    result = self._spotify.playlist_tracks(uri_id, limit=1)
-                    total = result.get('total', 0)
-                    return total if total > 0 else None
-                except Exception as e:
-                    logger.debug(f"Could not get playlist track count: {e}")
-                    return None
-            elif uri_type == 'album':
-                # Get album tracks count
-                try:
-                    album = self._spotify.album(uri_id)
-                    tracks = album.get('tracks', {})
-                    if isinstance(tracks, dict):
-                        total = tracks.get('total', 0)
-                        return total if total > 0 else None
-                    return None
-                except Exception as e:
-                    logger.debug(f"Could not get album track count: {e}")
-                    return None
-            else:
-                return None
+        Returns:
+            Number of tracks, or None if unable to determine
+        """
+        try:
+            # Use playlist_tracks with limit=1 to get total count efficiently
+            result = self._api_call('playlist_tracks', playlist_id, limit=1)
+            total = result.get('total', 0)
+            return total if total > 0 else None
+        except Exception as e:
+            logger.debug("Could not get playlist track count: %s", e)
+            return None
+    
+    def _album_track_count(self, album_id: str) -> Optional[int]:
+        """
+        Get the number of tracks on an album.
+        
+        Args:
+            album_id: Spotify album ID
+            
+        Returns:
+            Number of tracks, or None if unable to determine
+        """
+        try:
+            album = self._api_call('album', album_id)
+            tracks = album.get('tracks', {})
+            if isinstance(tracks, dict):
+                total = tracks.get('total', 0)
+                return total if total > 0 else None
+            return None
         except Exception as e:
-            logger.debug(f"Error getting track count: {e}")
+            logger.debug("Could not get album track count: %s", e)
             return None
     
+    def _do_playback(self, uri: str, random_offset: Optional[int]):
+        """
+        Start playback of a context on our device, enable shuffle and start monitoring.
+        
+        Args:
+            uri: Spotify URI of the playlist/album/track to play
+            random_offset: Track index to start from, or None to start from the beginning
+            
+        Raises:
+            spotipy.exceptions.SpotifyException: If the Web API rejects the playback request
+        """
+        prev_track_id = self._current_track_id
+        if random_offset is not None:
+            # Start from random position
+            self._send_player_command(
+                'start_playback',
+                device_id=self._device_id,
+                context_uri=uri,
+                offset={'position': random_offset}
+            )
+            logger.info(f"Started playback from random position: {uri}")
+        else:
+            # Start from beginning (single track or couldn't get count)
+            self._send_player_command('start_playback', device_id=self._device_id, context_uri=uri)
+            logger.info(f"Started playback: {uri}")
+        
+        self._mark_playing()
+        
+        # Wait for playback to start, then get current track info
+        # (a cold start on a slow network can take a while, so allow up to 2s)
+        playback = self._wait_for_track_change(prev_track_id, timeout=2.0, context_uri=uri)
+        if playback is None:
+            # Not confirmed within 2s (slow cold start) - take one more look, but never
+            # show the previous context's track or clear the item just because it's late
+            try:
+                latest = self._get_playback(max_age=0)
+            except Exception as e:
+                logger.debug("Could not get playback state after starting playback: %s", e)
+                latest = None
+            if latest and latest.get('item') and (latest.get('context') or {}).get('uri') == uri:
+                playback = latest
+            else:
+                logger.debug("Playback of %s not confirmed yet - leaving the current item as it is", uri)
+        if playback is not None:
+            self._apply_playback_to_current(playback)
+        
+        # Enable shuffle mode - the player keeps it across contexts, so this is
+        # usually already on and the extra request can be skipped, but only trust
+        # a shuffle_state reported for the context we just started
+        confirmed = bool(playback) and (playback.get('context') or {}).get('uri') == uri
+        if not (confirmed and playback.get('shuffle_state')):
+            try:
+                self._send_player_command('shuffle', state=True, device_id=self._device_id)
+                logger.info("Shuffle mode enabled")
+            except Exception as shuffle_error:
+                logger.warning(f"Could not enable shuffle mode: {shuffle_error}")
+                # Continue anyway - playback started successfully
+        
+        # Start monitoring thread to detect when playlist ends
+        self._start_monitoring()
+    
+    def _mark_playing(self):
+        """Record that playback started, clearing the paused flag before the playing state is set."""
+        self._pause_requested = False
+        self._paused_event.clear()
+        self.set_playing_state(True)
+        self._state_changed_at = time.monotonic()
+    
     def play(self, source_id: str, **kwargs) -> bool:
         """
         Start playing a Spotify playlist, album, or track.
@@ -783,12 +1578,21 @@ class SpotifyBackend(BaseBackend):
         try:
             if not self._spotify:
                 raise BackendError("Spotify client not initialized")
+            if not self._spotify_verified:
+                self._verify_spotify_auth()
+            self._shutdown_event.clear()
+            # Checks within this play() share one raspotify status probe, but never reuse one from before it
+            self._invalidate_raspotify_status()
             
             # Get URI to play
             playlist_id = kwargs.get('playlist_id') or source_id
             uri = self._normalize_uri(playlist_id)
             self._current_playlist_id = uri
             
+            # Fetch the track count in the background - it doesn't depend on the device,
+            # so the HTTP round-trip overlaps with device lookup and activation below
+            track_count_future = self._get_io_pool().submit(self._get_track_count, uri)
+            
             # Ensure we have a device (with automatic activation retries)
             # This will also check for raspotify if needed
             self._ensure_device(retry=True)
@@ -803,6 +1607,7 @@ class SpotifyBackend(BaseBackend):
                         # Double-check - it might have been running but our check failed
                         # or it might have started in the meantime
                         time.sleep(0.5)
+                        self._invalidate_raspotify_status()
                         if self._check_raspotify_running():
                             logger.info("raspotify is running (verified after start attempt)")
                         else:
@@ -818,179 +1623,37 @@ class SpotifyBackend(BaseBackend):
                 if not self._ensure_device_active():
                     # Device activation failed, try to refresh device
                     logger.warning("Device activation failed, refreshing device...")
-                    self._device_id = None
-                    self._last_device_check = 0
+                    self._forget_device()
                     self._ensure_device(retry=True)
                     if self._device_id:
                         self._ensure_device_active()
             
             # Get track count and pick a random starting position for shuffle
-            track_count = self._get_track_count(uri)
+            track_count = track_count_future.result()
             random_offset = None
             if track_count and track_count > 1:
                 # Pick a random track index (0-based)
-                random_offset = random.randint(0, track_count - 1)
+                random_offset = random.randrange(track_count)
                 logger.info(f"Starting playback from random track {random_offset + 1} of {track_count}")
             
-            # Start playback
-            try:
-                if random_offset is not None:
-                    # Start from random position
-                    self._spotify.start_playback(
-                        device_id=self._device_id,
-                        context_uri=uri,
-                        offset={'position': random_offset}
-                    )
-                    logger.info(f"Started playback from random position: {uri}")
-                else:
-                    # Start from beginning (single track or couldn't get count)
-                    self._spotify.start_playback(device_id=self._device_id, context_uri=uri)
-                    logger.info(f"Started playback: {uri}")
-                
-                # Enable shuffle mode
+            # Start playback. An expired token and an inactive device are each recovered
+            # from once, keeping the same random starting position
+            recovered = set()
+            while True:
                 try:
-                    self._spotify.shuffle(state=True, device_id=self._device_id)
-                    logger.info("Shuffle mode enabled")
-                except Exception as shuffle_error:
-                    logger.warning(f"Could not enable shuffle mode: {shuffle_error}")
-                    # Continue anyway - playback started successfully
-                
-                self.set_playing_state(True)
-                self._is_paused = False
-                
-                # Try to get current track info
-                time.sleep(1)  # Wait a bit for playback to start
-                self._update_current_item()
-                
-                # Start monitoring thread to detect when playlist ends
-                self._start_monitoring()
-                
-                return True
-            except spotipy.exceptions.SpotifyException as e:
-                if e.http_status == 401:
-                    # Token expired or invalid - try to refresh
-                    logger.warning("Received 401 Unauthorized - token may be expired, attempting refresh...")
-                    try:
-                        # Reinitialize Spotify client to trigger token refresh
-                        self._init_spotify()
-                        self._last_token_refresh = time.time()
-                        
-                        # Get track count and pick a random starting position for shuffle
-                        track_count = self._get_track_count(uri)
-                        random_offset = None
-                        if track_count and track_count > 1:
-                            random_offset = random.randint(0, track_count - 1)
-                            logger.info(f"Starting playback from random track {random_offset + 1} of {track_count} (after refresh)")
-                        
-                        # Retry playback
-                        if random_offset is not None:
-                            self._spotify.start_playback(
-                                device_id=self._device_id,
-                                context_uri=uri,
-                                offset={'position': random_offset}
-                            )
-                            logger.info(f"Started playback from random position after token refresh: {uri}")
-                        else:
-                            self._spotify.start_playback(device_id=self._device_id, context_uri=uri)
-                            logger.info(f"Started playback after token refresh: {uri}")
-                        
-                        # Enable shuffle mode
-                        try:
-                            self._spotify.shuffle(state=True, device_id=self._device_id)
-                            logger.info("Shuffle mode enabled after token refresh")
-                        except Exception as shuffle_error:
-                            logger.warning(f"Could not enable shuffle mode: {shuffle_error}")
-                        
-                        self.set_playing_state(True)
-                        self._is_paused = False
-                        time.sleep(1)
-                        self._update_current_item()
-                        
-                        # Start monitoring thread to detect when playlist ends
-                        self._start_monitoring()
-                        
-                        return True
-                    except Exception as refresh_error:
-                        error_str = str(refresh_error).lower()
-                        # Check if refresh token has expired
-                        if 'invalid_grant' in error_str or ('refresh_token' in error_str and ('expired' in error_str or 'invalid' in error_str)):
-                            play_auth_error_beep()
-                            raise BackendError(
-                                "Spotify refresh token has expired. You need to re-authenticate:\n"
-                                f"  Run: python3 {Path(__file__).parent.parent / 'scripts' / 'spotify_oauth_setup.py'}\n"
-                                "This will generate a new refresh token. Refresh tokens expire after ~60 days of inactivity."
-                            )
-                        else:
-                            play_auth_error_beep()
-                            raise BackendError(
-                                f"Authentication failed and token refresh unsuccessful: {refresh_error}. "
-                                "You may need to run spotify_oauth_setup.py again to re-authenticate."
-                            )
-                elif e.http_status == 404:
-                    # 404 could mean device not found OR playlist not found
-                    # Check if it's a device issue first
-                    error_msg = str(e).lower()
-                    if 'device' in error_msg or 'not found' in error_msg:
-                        logger.warning("Received 404 - device may not be active. Attempting to activate device...")
-                        # Try to activate device and retry
-                        if self._ensure_device_active():
-                            # Recalculate track count and offset for retry
-                            track_count = self._get_track_count(uri)
-                            random_offset = None
-                            if track_count and track_count > 1:
-                                random_offset = random.randint(0, track_count - 1)
-                                logger.info(f"Starting playback from random track {random_offset + 1} of {track_count} (after device activation)")
-                            
-                            # Retry playback once
-                            try:
-                                if random_offset is not None:
-                                    self._spotify.start_playback(
-                                        device_id=self._device_id,
-                                        context_uri=uri,
-                                        offset={'position': random_offset}
-                                    )
-                                    logger.info(f"Started playback after device activation: {uri}")
-                                else:
-                                    self._spotify.start_playback(device_id=self._device_id, context_uri=uri)
-                                    logger.info(f"Started playback after device activation: {uri}")
-                                
-                                # Enable shuffle mode
-                                try:
-                                    self._spotify.shuffle(state=True, device_id=self._device_id)
-                                    logger.info("Shuffle mode enabled after device activation")
-                                except Exception as shuffle_error:
-                                    logger.warning(f"Could not enable shuffle mode: {shuffle_error}")
-                                
-                                self.set_playing_state(True)
-                                self._is_paused = False
-                                time.sleep(1)
-                                self._update_current_item()
-                                self._start_monitoring()
-                                return True
-                            except Exception as retry_error:
-                                logger.error(f"Playback still failed after device activation: {retry_error}")
-                                play_not_found_beep()
-                                raise BackendError(f"Failed to start playback: {retry_error}")
-                        else:
-                            play_not_found_beep()
-                            raise BackendError(f"Device not found and could not be activated")
-                    else:
-                        play_not_found_beep()
-                        raise BackendError(f"Playlist/album/track not found: {uri}")
-                elif e.http_status == 403:
-                    raise BackendError("Permission denied. Make sure your Spotify account has Premium.")
-                else:
-                    raise BackendError(f"Spotify API error: {e}")
+                    self._do_playback(uri, random_offset)
+                    return True
+                except SpotifyException as e:
+                    # Re-check the device sooner after any API error
+                    self._device_verified = False
+                    self._invalidate_devices_cache()
+                    self._recover_playback_error(e, uri, recovered)
                     
         except BackendError:
             raise
         except Exception as e:
             # Check if it's a network-related error
-            error_str = str(e).lower()
-            error_type = type(e).__name__.lower()
-            
-            if any(keyword in error_str or keyword in error_type for keyword in 
-                   ['network', 'connection', 'timeout', 'dns', 'socket', 'urlerror', 'requests']):
+            if _NET_ERR_RE.search(f"{e}|{type(e).__name__}"):
                 play_network_error_beep()
             else:
                 # For other errors, play connection error (handled by player_controller)
@@ -1000,48 +1663,142 @@ class SpotifyBackend(BaseBackend):
             self.set_playing_state(False)
             raise BackendError(f"Failed to start playback: {e}")
     
+    def _recover_playback_error(self, e, uri: str, recovered: set):
+        """
+        Recover from a failed start_playback so play() can try again, or raise.
+        
+        Args:
+            e: SpotifyException raised while starting playback
+            uri: Spotify URI being played
+            recovered: HTTP statuses already recovered from during this play(); updated
+            
+        Raises:
+            BackendError: If the error can't be recovered from (or already was once)
+        """
+        status = e.http_status
+        if status == 401:
+            if status in recovered:
+                play_auth_error_beep()
+                raise BackendError(
+                    f"Authentication failed and token refresh unsuccessful: {e}. "
+                    "You may need to run spotify_oauth_setup.py again to re-authenticate."
+                )
+            recovered.add(status)
+            # Token expired or invalid - try to refresh
+            logger.warning("Received 401 Unauthorized - token may be expired, attempting refresh...")
+            try:
+                # Refresh the access token (the client and its HTTP session are kept)
+                self._refresh_token_in_place()
+                self._last_token_refresh = time.time()
+            except Exception as refresh_error:
+                error_str = str(refresh_error).lower()
+                play_auth_error_beep()
+                # Check if refresh token has expired
+                if 'invalid_grant' in error_str or ('refresh_token' in error_str and ('expired' in error_str or 'invalid' in error_str)):
+                    raise BackendError(
+                        "Spotify refresh token has expired. You need to re-authenticate:\n"
+                        f"  Run: python3 {Path(__file__).parent.parent / 'scripts' / 'spotify_oauth_setup.py'}\n"
+                        "This will generate a new refresh token. Refresh tokens expire after ~60 days of inactivity."
+                    )
+                raise BackendError(
+                    f"Authentication failed and token refresh unsuccessful: {refresh_error}. "
+                    "You may need to run spotify_oauth_setup.py again to re-authenticate."
+                )
+        elif status == 404:
+            # 404 could mean device not found OR playlist not found
+            # Check if it's a device issue first
+            error_msg = str(e).lower()
+            if 'device' not in error_msg and 'not found' not in error_msg:
+                play_not_found_beep()
+                raise BackendError(f"Playlist/album/track not found: {uri}")
+            if status in recovered:
+                logger.error(f"Playback still failed after device activation: {e}")
+                play_not_found_beep()
+                raise BackendError(f"Failed to start playback: {e}")
+            recovered.add(status)
+            logger.warning("Received 404 - device may not be active. Attempting to activate device...")
+            if not self._ensure_device_active():
+                play_not_found_beep()
+                raise BackendError("Device not found and could not be activated")
+        elif status == 403:
+            raise BackendError("Permission denied. Make sure your Spotify account has Premium.")
+        else:
+            raise BackendError(f"Spotify API error: {e}")
+    
+    def _record_web_api_failure(self):
+        """Count a failed Web API call, failing calls fast for a while once too many fail in a row."""
+        self._web_api_failures += 1
+        if self._web_api_failures >= self._web_api_failure_threshold:
+            self._web_api_open_until = time.monotonic() + self._web_api_reset_after
+            logger.warning(
+                "Spotify Web API failed %d times in a row - skipping Web API calls for %.0fs",
+                self._web_api_failures, self._web_api_reset_after
+            )
+    
+    @_spotify_call
+    def _api_call(self, method: str, *args, **kwargs):
+        """
+        Call a Web API method of the Spotify client.
+        
+        Goes through _spotify_call (401 refresh, rate-limit hold-off, circuit breaker)
+        and _with_retry. Cached lookups call this only on a cache miss, so the breaker
+        only ever sees real requests.
+        
+        Args:
+            method: Name of the spotipy method to call
+            *args: Positional arguments for it
+            **kwargs: Keyword arguments for it (and _with_retry's max_429_retries)
+            
+        Returns:
+            Whatever the spotipy method returns
+        """
+        return _with_retry(getattr(self._spotify, method), *args, **kwargs)
+    
+    def _send_player_command(self, command: str, **kwargs):
+        """
+        Send a playback command (start_playback, next_track, ...) to the Web API.
+        
+        Args:
+            command: Name of the spotipy method to call
+            **kwargs: Arguments for it (normally device_id)
+        """
+        self._api_call(command, **kwargs)
+        self._invalidate_playback_cache()
+    
     def pause(self) -> bool:
         """Pause playback."""
+        # Flag it before the request, so the monitor never mistakes this pause for a playlist end
+        self._pause_requested = True
         try:
             # Try Web API first
             if self._spotify and self._device_id:
                 try:
-                    self._spotify.pause_playback(device_id=self._device_id)
-                    self._is_paused = True
+                    self._send_player_command('pause_playback', device_id=self._device_id)
+                    self._paused_event.set()
                     # Keep _is_playing = True (we have a track, just paused)
                     # Don't set it to False, as that would indicate stopped, not paused
                     logger.info("Paused Spotify playback (Web API)")
                     return True
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized during pause - attempting token refresh...")
-                        try:
-                            self._init_spotify()
-                            self._spotify.pause_playback(device_id=self._device_id)
-                            self._is_paused = True
-                            logger.info("Paused Spotify playback (Web API) after token refresh")
-                            return True
-                        except Exception:
-                            logger.debug("Web API pause failed after token refresh, trying MPRIS fallback")
-                    else:
-                        logger.debug(f"Web API pause failed: {e}, trying MPRIS fallback")
                 except Exception as e:
-                    logger.debug(f"Web API pause failed: {e}, trying MPRIS fallback")
+                    logger.debug("Web API pause failed: %s, trying MPRIS fallback", e)
             
             # Fallback to MPRIS
-            if self._mpris_player:
+            if self._get_mpris():
                 try:
                     self._mpris_player.Pause()
-                    self._is_paused = True
+                    self._invalidate_playback_cache()
+                    self._paused_event.set()
                     # Keep _is_playing = True (we have a track, just paused)
                     logger.info("Paused Spotify playback (MPRIS)")
                     return True
                 except Exception as e:
-                    logger.debug(f"MPRIS pause failed: {e}")
+                    logger.debug("MPRIS pause failed: %s", e)
             
+            self._pause_requested = False
             return False
         except Exception as e:
             logger.error(f"Error pausing: {e}")
+            self._pause_requested = False
             return False
     
     def resume(self) -> bool:
@@ -1050,38 +1807,23 @@ class SpotifyBackend(BaseBackend):
             # Try Web API first
             if self._spotify and self._device_id:
                 try:
-                    self._spotify.start_playback(device_id=self._device_id)
-                    self._is_paused = False
-                    self.set_playing_state(True)
+                    self._send_player_command('start_playback', device_id=self._device_id)
+                    self._mark_playing()
                     logger.info("Resumed Spotify playback (Web API)")
                     return True
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized during resume - attempting token refresh...")
-                        try:
-                            self._init_spotify()
-                            self._spotify.start_playback(device_id=self._device_id)
-                            self._is_paused = False
-                            self.set_playing_state(True)
-                            logger.info("Resumed Spotify playback (Web API) after token refresh")
-                            return True
-                        except Exception:
-                            logger.debug("Web API resume failed after token refresh, trying MPRIS fallback")
-                    else:
-                        logger.debug(f"Web API resume failed: {e}, trying MPRIS fallback")
                 except Exception as e:
-                    logger.debug(f"Web API resume failed: {e}, trying MPRIS fallback")
+                    logger.debug("Web API resume failed: %s, trying MPRIS fallback", e)
             
             # Fallback to MPRIS
-            if self._mpris_player:
+            if self._get_mpris():
                 try:
                     self._mpris_player.Play()
-                    self._is_paused = False
-                    self.set_playing_state(True)
+                    self._invalidate_playback_cache()
+                    self._mark_playing()
                     logger.info("Resumed Spotify playback (MPRIS)")
                     return True
                 except Exception as e:
-                    logger.debug(f"MPRIS resume failed: {e}")
+                    logger.debug("MPRIS resume failed: %s", e)
             
             return False
         except Exception as e:
@@ -1090,6 +1832,8 @@ class SpotifyBackend(BaseBackend):
     
     def stop(self) -> bool:
         """Stop playback completely."""
+        # Interrupt any device lookup still waiting in play()
+        self._shutdown_event.set()
         try:
             if not self._spotify:
                 return True  # Already stopped
@@ -1097,57 +1841,23 @@ class SpotifyBackend(BaseBackend):
             try:
                 self._ensure_device()
                 # Pause playback to stop it
-                try:
-                    self._spotify.pause_playback(device_id=self._device_id)
-                    logger.info("Paused Spotify playback (stop)")
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized during stop pause - attempting token refresh...")
-                        try:
-                            self._init_spotify()
-                            self._spotify.pause_playback(device_id=self._device_id)
-                            logger.info("Paused Spotify playback (stop) after token refresh")
-                        except Exception:
-                            logger.debug("Could not pause during stop after token refresh")
-                    else:
-                        raise
-                
-                # Wait a moment and verify it's actually stopped
-                time.sleep(0.2)
+                self._send_player_command('pause_playback', device_id=self._device_id)
+                logger.info("Paused Spotify playback (stop)")
                 
-                # Check if it's still playing and force stop if needed
-                try:
-                    playback = self._spotify.current_playback()
-                    if playback and playback.get('is_playing', False):
-                        # Still playing, try to pause again more aggressively
-                        logger.warning("Spotify still playing after pause, forcing stop...")
-                        self._spotify.pause_playback(device_id=self._device_id)
-                        time.sleep(0.2)
-                        
-                        # Check one more time
-                        playback = self._spotify.current_playback()
-                        if playback and playback.get('is_playing', False):
-                            logger.error("Spotify still playing after multiple stop attempts!")
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized during stop - token may need refresh")
-                        # Try to refresh and continue
-                        try:
-                            self._init_spotify()
-                        except Exception:
-                            pass  # Continue anyway
-                    else:
-                        logger.debug(f"Could not verify stop status: {e}")
-                except Exception as e:
-                    logger.debug(f"Could not verify stop status: {e}")
+                # Verify it's actually stopped in the background, so switching sources
+                # doesn't wait on the extra round-trips
+                self._get_io_pool().submit(self._verify_stopped, self._device_id)
                     
             except Exception as e:
                 # If pause fails, log but continue - device might not be available
-                logger.debug(f"Could not pause during stop (may already be stopped): {e}")
+                logger.debug("Could not pause during stop (may already be stopped): %s", e)
             
             self.set_playing_state(False)
-            self._is_paused = False
+            self._pause_requested = False
+            self._paused_event.clear()
+            self._state_changed_at = time.monotonic()
             self.set_current_item(None)
+            self._current_track_id = None
             self._current_playlist_id = None
             
             # Stop monitoring thread
@@ -1167,42 +1877,28 @@ class SpotifyBackend(BaseBackend):
     
     def next(self) -> bool:
         """Skip to next track."""
+        prev_track_id = self._current_track_id
         try:
             # Try Web API first
             if self._spotify and self._device_id:
                 try:
-                    self._spotify.next_track(device_id=self._device_id)
+                    self._send_player_command('next_track', device_id=self._device_id)
                     logger.info("Skipped to next track (Web API)")
-                    time.sleep(0.5)
-                    self._update_current_item()
+                    self._apply_playback_to_current(self._wait_for_track_change(prev_track_id))
                     return True
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized during next - attempting token refresh...")
-                        try:
-                            self._init_spotify()
-                            self._spotify.next_track(device_id=self._device_id)
-                            logger.info("Skipped to next track (Web API) after token refresh")
-                            time.sleep(0.5)
-                            self._update_current_item()
-                            return True
-                        except Exception:
-                            logger.debug("Web API next failed after token refresh, trying MPRIS fallback")
-                    else:
-                        logger.debug(f"Web API next failed: {e}, trying MPRIS fallback")
                 except Exception as e:
-                    logger.debug(f"Web API next failed: {e}, trying MPRIS fallback")
+                    logger.debug("Web API next failed: %s, trying MPRIS fallback", e)
             
             # Fallback to MPRIS
-            if self._mpris_player:
+            if self._get_mpris():
                 try:
                     self._mpris_player.Next()
+                    self._invalidate_playback_cache()
                     logger.info("Skipped to next track (MPRIS)")
-                    time.sleep(0.5)
-                    self._update_current_item()
+                    self._apply_playback_to_current(self._wait_for_track_change(prev_track_id))
                     return True
                 except Exception as e:
-                    logger.debug(f"MPRIS next failed: {e}")
+                    logger.debug("MPRIS next failed: %s", e)
             
             return False
         except Exception as e:
@@ -1211,215 +1907,520 @@ class SpotifyBackend(BaseBackend):
     
     def previous(self) -> bool:
         """Go to previous track."""
+        prev_track_id = self._current_track_id
         try:
             # Try Web API first
             if self._spotify and self._device_id:
                 try:
-                    self._spotify.previous_track(device_id=self._device_id)
+                    self._send_player_command('previous_track', device_id=self._device_id)
                     logger.info("Went to previous track (Web API)")
-                    time.sleep(0.5)
-                    self._update_current_item()
+                    self._apply_playback_to_current(self._wait_for_track_change(prev_track_id))
                     return True
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized during previous - attempting token refresh...")
-                        try:
-                            self._init_spotify()
-                            self._spotify.previous_track(device_id=self._device_id)
-                            logger.info("Went to previous track (Web API) after token refresh")
-                            time.sleep(0.5)
-                            self._update_current_item()
-                            return True
-                        except Exception:
-                            logger.debug("Web API previous failed after token refresh, trying MPRIS fallback")
-                    else:
-                        logger.debug(f"Web API previous failed: {e}, trying MPRIS fallback")
                 except Exception as e:
-                    logger.debug(f"Web API previous failed: {e}, trying MPRIS fallback")
+                    logger.debug("Web API previous failed: %s, trying MPRIS fallback", e)
             
             # Fallback to MPRIS
-            if self._mpris_player:
+            if self._get_mpris():
                 try:
                     self._mpris_player.Previous()
+                    self._invalidate_playback_cache()
                     logger.info("Went to previous track (MPRIS)")
-                    time.sleep(0.5)
-                    self._update_current_item()
+                    self._apply_playback_to_current(self._wait_for_track_change(prev_track_id))
                     return True
                 except Exception as e:
-                    logger.debug(f"MPRIS previous failed: {e}")
+                    logger.debug("MPRIS previous failed: %s", e)
             
             return False
         except Exception as e:
             logger.error(f"Error going to previous: {e}")
             return False
     
+    def _verify_stopped(self, device_id: Optional[str]):
+        """
+        Check that playback really stopped after stop() paused it, pausing again if not.
+        
+        Runs on the I/O pool after stop() has returned. Bails out as soon as play()
+        starts new playback, so a quick switch back to Spotify is never paused by a
+        stale check.
+        
+        Args:
+            device_id: Device that stop() paused
+        """
+        try:
+            if self._wait_for_stopped() is not False:
+                return  # Stopped, or play() was called since
+            
+            # Still playing, try to pause again more aggressively
+            logger.warning("Spotify still playing after pause, forcing stop...")
+            self._send_player_command('pause_playback', device_id=device_id)
+            
+            # Check one more time
+            if self._wait_for_stopped() is False:
+                logger.error("Spotify still playing after multiple stop attempts!")
+        except Exception as e:
+            logger.debug("Could not verify stop status: %s", e)
+    
+    def _wait_for_stopped(self) -> Optional[bool]:
+        """
+        Poll current playback until it is no longer playing.
+        
+        Polls back off (50ms, 100ms, ... about 0.5s in total), so a pause that takes
+        effect quickly costs a single request.
+        
+        Returns:
+            True if playback stopped, False if it was still playing at the last poll,
+            None if play() started new playback in the meantime
+        """
+        for delay in _STOP_POLL_DELAYS:
+            time.sleep(delay)
+            if not self._shutdown_event.is_set():
+                return None
+            playback = self._get_playback(max_age=0)
+            if not (playback and playback.get('is_playing', False)):
+                return True
+        return False
+    
+    def _get_playback(self, max_age: Optional[float] = None, max_429_retries: int = 2) -> Optional[dict]:
+        """
+        Get current playback state, reusing a recent response.
+        
+        Args:
+            max_age: Maximum age in seconds of a cached response to reuse (defaults to the playback TTL)
+            max_429_retries: How many 429s to wait out - 0 for status polls that would rather
+                fail fast than sleep (the next poll asks again anyway)
+            
+        Returns:
+            Payload of the Spotify current_playback() call (None if nothing is playing)
+        """
+        if max_age is None:
+            max_age = self._playback_ttl
+        playback, fetched_at = self._playback_cache
+        if fetched_at and time.monotonic() - fetched_at < max_age:
+            return playback
+        
+        playback = self._api_call('current_playback', max_429_retries=max_429_retries)
+        self._playback_cache = (playback, time.monotonic())
+        self._is_playing_cache = (0.0, False)  # Derived from the old state
+        return playback
+    
+    def _invalidate_playback_cache(self):
+        """Drop the cached playback state after a command that changes it."""
+        self._playback_cache = (None, 0.0)
+        self._is_playing_cache = (0.0, False)
+        self._mpris_snapshot_cache = (0.0, None)
+    
+    def _mpris_snapshot(self) -> dict:
+        """
+        Get all MPRIS player properties in one D-Bus call, reusing a recent result.
+        
+        Returns:
+            Properties of org.mpris.MediaPlayer2.Player (PlaybackStatus, Metadata, Position, ...)
+            
+        Raises:
+            dbus.exceptions.DBusException: If the player can't be queried
+        """
+        fetched_at, snapshot = self._mpris_snapshot_cache
+        if snapshot is not None and time.monotonic() - fetched_at < self._mpris_snapshot_ttl:
+            return snapshot
+        
+        snapshot = self._mpris_props.GetAll('org.mpris.MediaPlayer2.Player')
+        self._mpris_snapshot_cache = (time.monotonic(), snapshot)
+        return snapshot
+    
+    def _wait_for_track_change(self, prev_id: Optional[str], timeout: float = 1.0,
+                               context_uri: Optional[str] = None) -> Optional[dict]:
+        """
+        Poll current playback until a track other than prev_id is playing.
+        
+        Polls back off (100ms, 150ms, 250ms, ... up to 1s apart) so a quick change is seen
+        almost immediately without hammering the API during a slow one.
+        
+        Args:
+            prev_id: Spotify ID of the track playing before the change
+            timeout: Maximum number of seconds to wait
+            context_uri: If given, only playback from this context counts (the state from
+                before the switch may still be reported at first). Its first track may be
+                prev_id itself (e.g. replaying a playlist from the same track) - that is
+                accepted once the timeout runs out without another track showing up
+            
+        Returns:
+            Last playback state fetched (None if nothing is playing or it couldn't be fetched;
+            with context_uri, None unless playback from that context was seen)
+        """
+        deadline = time.monotonic() + timeout
+        delays = iter(_TRACK_CHANGE_POLL_DELAYS)
+        context_match = None
+        while True:
+            try:
+                playback = self._get_playback(max_age=0, max_429_retries=0)  # Waiting out a 429 would overrun the timeout
+            except Exception as e:
+                logger.debug("Could not poll playback state: %s", e)
+                playback = None
+            if playback:
+                track_id = (playback.get('item') or {}).get('id')
+                if context_uri is None:
+                    if track_id and track_id != prev_id:
+                        return playback
+                elif (track_id and playback.get('is_playing')
+                        and (playback.get('context') or {}).get('uri') == context_uri):
+                    if track_id != prev_id:
+                        return playback
+                    context_match = playback
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return playback if context_uri is None else context_match
+            time.sleep(min(next(delays, _TRACK_CHANGE_POLL_DELAYS[-1]), remaining))
+    
     def _update_current_item(self):
         """Update current track information."""
         try:
             if not self._spotify:
                 return
             
-            try:
-                playback = self._spotify.current_playback()
-            except spotipy.exceptions.SpotifyException as e:
-                if e.http_status == 401:
-                    logger.debug("Received 401 Unauthorized while updating current item - attempting token refresh...")
-                    try:
-                        self._init_spotify()
-                        playback = self._spotify.current_playback()
-                    except Exception:
-                        # If refresh fails, just skip updating current item
-                        return
-                else:
-                    # For other errors, just skip updating
-                    return
-            
-            if playback and playback.get('item'):
-                item = playback['item']
-                title = item.get('name', 'Unknown')
-                artists = [artist['name'] for artist in item.get('artists', [])]
-                artist_str = ', '.join(artists) if artists else 'Unknown'
-                self.set_current_item(f"{artist_str} - {title}")
-            else:
-                self.set_current_item(None)
+            self._apply_playback_to_current(self._get_playback())
         except Exception as e:
-            logger.debug(f"Could not update current item: {e}")
+            logger.debug("Could not update current item: %s", e)
             # Don't fail if we can't get track info
     
+    def _apply_playback_to_current(self, playback: Optional[dict]):
+        """
+        Update current track information from an already fetched playback state.
+        
+        Args:
+            playback: Playback state from current_playback(), or None if nothing is playing
+        """
+        if playback and playback.get('item'):
+            item = playback['item']
+            track_id = item.get('id')
+            if track_id and track_id == self._current_track_id and self._current_item is not None:
+                return  # Same track - the display string is already up to date
+            self._current_track_id = track_id
+            title = item.get('name') or 'Unknown'
+            artist_str = ', '.join(artist.get('name', '') for artist in item.get('artists') or ()) or 'Unknown'
+            self.set_current_item(f"{artist_str} - {title}")
+        else:
+            self._current_track_id = None
+            self.set_current_item(None)
+    
     def is_playing(self) -> bool:
-        """Check if currently playing (and not paused)."""
+        """
+        Check if currently playing (and not paused).
+        
+        Results are shared between callers for _is_playing_ttl seconds. If another
+        thread is already refreshing the state, its last answer is returned rather
+        than queueing a second Web API/MPRIS round-trip behind it.
+        """
+        # If we're paused, return False immediately (the API may not have caught up yet)
+        if self._paused_event.is_set():
+            return False
+        
+        # Right after play()/resume()/stop() we know the answer better than the API does
+        if time.monotonic() - self._state_changed_at < self._own_state_ttl:
+            return self._is_playing
+        
+        checked_at, result = self._is_playing_cache
+        if checked_at and time.monotonic() - checked_at < self._is_playing_ttl:
+            return result
+        if not self._is_playing_lock.acquire(blocking=False):
+            return result if checked_at else self._is_playing
         try:
-            # Check internal paused state first - if we're paused, return False immediately
-            # This prevents race conditions where API hasn't updated yet
-            if self._is_paused:
-                return False
-            
-            # Try Web API first
-            if self._spotify:
-                try:
-                    playback = self._spotify.current_playback()
-                    if playback:
-                        is_playing = playback.get('is_playing', False)
+            result = self._check_is_playing()
+            self._is_playing_cache = (time.monotonic(), result)
+            return result
+        finally:
+            self._is_playing_lock.release()
+    
+    def _check_is_playing(self) -> bool:
+        """Ask each playing-state probe in turn; the first one that can answer wins."""
+        if not self._prefer_mpris and self._mpris_player is None and self._get_mpris():
+            self._prefer_mpris = True  # raspotify (re)appeared on D-Bus since the last search
+        probes = self._playing_probes_mpris_first if self._prefer_mpris else self._playing_probes
+        try:
+            for probe in probes:
+                is_playing = probe()
+                if is_playing is not None:
+                    # Steady state (still playing/still stopped) is a pure read
+                    if is_playing != self._is_playing:
                         self.set_playing_state(is_playing)
-                        # Only update _is_paused if API says we're not playing
-                        # Don't overwrite if we just paused (API might be stale)
-                        if not is_playing:
-                            self._is_paused = True
-                        return is_playing
-                    else:
-                        self.set_playing_state(False)
-                        return False
-                except spotipy.exceptions.SpotifyException as e:
-                    if e.http_status == 401:
-                        logger.debug("Received 401 Unauthorized while checking playback state - attempting token refresh...")
-                        try:
-                            self._init_spotify()
-                            # Retry once after refresh
-                            playback = self._spotify.current_playback()
-                            if playback:
-                                is_playing = playback.get('is_playing', False)
-                                self.set_playing_state(is_playing)
-                                if not is_playing:
-                                    self._is_paused = True
-                                return is_playing
-                            else:
-                                self.set_playing_state(False)
-                                return False
-                        except Exception:
-                            pass  # Fall through to MPRIS
-                    else:
-                        pass  # Fall through to MPRIS
-                except Exception:
-                    pass  # Fall through to MPRIS
-            
-            # Fallback to MPRIS
-            if self._mpris_player:
-                try:
-                    # Get playback status via Properties interface
-                    props = dbus.Interface(self._mpris_player, 'org.freedesktop.DBus.Properties')
-                    playback_status = props.Get('org.mpris.MediaPlayer2.Player', 'PlaybackStatus')
-                    is_playing = (playback_status == 'Playing')
-                    self.set_playing_state(is_playing)
-                    # Only update _is_paused if MPRIS says we're not playing
-                    if not is_playing:
-                        self._is_paused = True
                     return is_playing
-                except Exception:
-                    pass  # Fall through to internal state
+        except Exception as e:
+            logger.debug("Could not check playback state: %s", e)
+        
+        # Nothing could answer - fall back to internal state
+        return self._is_playing and not self._paused_event.is_set()
+    
+    def _probe_web_api_playing(self) -> Optional[bool]:
+        """
+        Get the playing state from the Web API.
+        
+        Returns:
+            Whether playback is running, or None if the Web API couldn't be reached
+        """
+        if not self._spotify:
+            return None
+        
+        try:
+            # Refreshes the token once on 401. is_playing() is called with the controller's
+            # lock held, so don't sleep through a rate limit here
+            playback = self._get_playback(max_429_retries=0)
+        except (requests.RequestException, SpotifyException, spotipy.oauth2.SpotifyOauthError):
+            return None
+        
+        if not playback:
+            return False
+        
+        is_playing = playback.get('is_playing', False)
+        # Only mark paused if API says we're not playing
+        # Don't overwrite if we just paused (API might be stale)
+        if not is_playing:
+            self._paused_event.set()
+        return is_playing
+    
+    def _probe_mpris_playing(self) -> Optional[bool]:
+        """
+        Get the playing state from MPRIS.
+        
+        Returns:
+            Whether playback is running, or None if there is no MPRIS player to ask
+        """
+        if not self._get_mpris():
+            self._prefer_mpris = False
+            return None
+        
+        try:
+            status = self._mpris_snapshot().get('PlaybackStatus')
+        except dbus.exceptions.DBusException:
+            self._mpris_failures += 1
+            if self._mpris_failures >= self._max_mpris_failures:
+                # The player has probably gone away (e.g. raspotify restarted) - look it up again next time
+                self._prefer_mpris = False
+                self._mpris_failures = 0
+                self._reset_mpris()
+            return None
+        
+        self._mpris_failures = 0
+        self._prefer_mpris = True
+        
+        # Only mark paused for an actual pause - 'Stopped' is what the end of a
+        # playlist looks like (like the Web API returning no playback at all)
+        if status == 'Paused':
+            self._paused_event.set()
+        elif status == 'Playing':
+            self._last_mpris_playing_ts = time.monotonic()
+        return status == 'Playing'
+    
+    def _track_position(self, playback: Optional[dict]) -> Optional[tuple[float, float]]:
+        """
+        Get the current track's position and length.
+        
+        Uses the Web API's progress_ms/duration_ms, or MPRIS Position/mpris:length when
+        no Web API playback is given.
+        
+        Args:
+            playback: Playback state from _get_playback(), or None
             
-            # Fallback to internal state
-            return self._is_playing and not self._is_paused
-        except Exception:
-            return self._is_playing and not self._is_paused
+        Returns:
+            (position, duration) in seconds, or None if neither source knows the track
+        """
+        item = playback.get('item') if playback else None
+        if item:
+            return (playback.get('progress_ms') or 0) / 1000.0, (item.get('duration_ms') or 0) / 1000.0
+        if self._mpris_player is None:
+            return None
+        try:
+            snapshot = self._mpris_snapshot()
+        except dbus.exceptions.DBusException:
+            return None
+        duration = int(snapshot.get('Metadata', {}).get('mpris:length', 0)) / 1e6
+        return int(snapshot.get('Position', 0)) / 1e6, duration
+    
+    def _stopped_at_track_end(self, playback: Optional[dict]) -> bool:
+        """
+        Check whether playback stopped at the very end of a track rather than mid-track.
+        
+        Args:
+            playback: Playback state from _get_playback(), or None
+            
+        Returns:
+            True if the current track's position is within _track_end_margin of its end
+        """
+        position = self._track_position(playback)
+        if not position:
+            return False
+        elapsed, duration = position
+        return duration > 0 and duration - elapsed < self._track_end_margin
+    
+    def _check_playlist_ended(self, stopped_checks: int, was_playing: bool, at_track_end: bool) -> tuple[int, bool]:
+        """
+        Count a monitor check that found playback stopped towards confirming the playlist ended.
+        
+        Only a stop after playing that isn't a pause counts. Stopping right at a track's end
+        can't be a mid-track pause, so it needs one re-check fewer (to ride out the gap
+        between tracks) - unless pause() was pressed, which always wins.
+        
+        Args:
+            stopped_checks: Consecutive stopped checks counted so far
+            was_playing: Whether playback was running at the previous check
+            at_track_end: Whether playback stopped within _track_end_margin of a track's end
+            
+        Returns:
+            (consecutive stopped checks including this one - 0 if it doesn't count,
+            whether that confirms the playlist ended)
+        """
+        paused = self._paused_event.is_set() and not (at_track_end and not self._pause_requested)
+        if not was_playing or paused:
+            return 0, False
+        stopped_checks += 1
+        required = self._required_end_checks if at_track_end else self._required_stopped_checks
+        return stopped_checks, stopped_checks >= required
+    
+    def _mpris_playing_recently(self) -> bool:
+        """Whether the local MPRIS player reported Playing within the last second."""
+        return time.monotonic() - self._last_mpris_playing_ts < 1.0
     
     def _start_monitoring(self):
-        """Start monitoring thread to detect when playlist ends."""
+        """Start monitoring playback (on the shared monitor thread) to detect when playlist ends."""
         if self._monitoring_active:
             return  # Already monitoring
         
         self._monitoring_active = True
-        self._was_playing = True
-        
-        def monitor():
-            self._monitor_playback()
+        # Each run gets its own event: a superseded run that is still finishing an HTTP
+        # call keeps its (set) event and exits at its next wait instead of sleeping on
+        self._monitor_stop_event = stop_event = threading.Event()
+        self._monitor_generation += 1
         
-        self._monitoring_thread = threading.Thread(target=monitor, daemon=True)
-        self._monitoring_thread.start()
-        logger.info("Started Spotify playback monitoring thread")
+        generation = self._monitor_generation
+        self._monitoring_future = _submit_monitor_job(lambda: self._monitor_playback(generation, stop_event))
+        logger.info("Started Spotify playback monitoring")
     
     def _stop_monitoring(self):
-        """Stop monitoring thread."""
+        """Stop monitoring playback."""
         if not self._monitoring_active:
             return
         
         self._monitoring_active = False
-        if self._monitoring_thread and self._monitoring_thread.is_alive():
-            # Thread will exit on next check
-            logger.info("Stopping Spotify playback monitoring thread")
+        self._monitor_generation += 1
+        self._monitor_stop_event.set()
+        future = self._monitoring_future
+        if future and not future.done() and threading.current_thread() is not _monitor_worker:
+            # The event wakes the monitor from its wait; give an in-flight poll a moment to finish
+            logger.info("Stopping Spotify playback monitoring")
+            try:
+                future.result(timeout=1.0)
+            except Exception:
+                pass  # Timed out or the run failed - either way it has been told to stop
     
-    def _monitor_playback(self):
+    def _next_monitor_interval(self, playback: Optional[dict], currently_playing: bool) -> float:
         """
-        Background thread to monitor Spotify playback and detect when playlist ends.
+        Work out how long the monitor can sleep before its next poll.
+        
+        While a track is playing nothing can end before the track does, so the
+        monitor sleeps until just after its expected end (capped at
+        _monitor_max_interval). Without a track to time it falls back to the
+        minimum interval.
+        
+        Args:
+            playback: Playback state from _get_playback(), or None to time the track from MPRIS
+            currently_playing: Result of the latest is_playing() check
+            
+        Returns:
+            Seconds to wait before the next check
+        """
+        position = self._track_position(playback) if currently_playing else None
+        if not position or not position[1]:
+            return self._monitor_min_interval
+        
+        elapsed, duration = position
+        remaining = max(0.0, duration - elapsed)
+        return max(self._monitor_min_interval, min(self._monitor_max_interval, remaining + 2.0))
+    
+    def _monitor_playback(self, generation: int, stop_event: threading.Event):
+        """
+        Monitor Spotify playback (on the shared monitor thread) and detect when playlist ends.
         When playlist ends naturally (not paused), notify callback to cycle to next source.
+        
+        Args:
+            generation: _monitor_generation when this run was started. Once monitoring is
+                stopped or restarted the run exits, so a stale run never reports an end
+                that belongs to playback it was not started for
+            stop_event: This run's stop event, set by _stop_monitoring() to wake it early
         """
         consecutive_stopped_checks = 0
-        required_stopped_checks = 3  # Require 3 consecutive checks to confirm playlist ended
+        was_playing = True  # Previous playing state, to detect a natural end (only this thread uses it)
+        
+        # Bind what the loop touches every iteration to locals
+        stop_wait = stop_event.wait
+        get_playback = self._get_playback
+        is_playing = self.is_playing
+        min_interval = self._monitor_min_interval
+        max_interval = self._monitor_max_interval
+        idle_interval = min_interval  # Backs off while there is nothing that could end
+        error_backoff = 0.1  # Wait after a failed iteration, doubled per consecutive failure (max 5s)
+        error_count = 0  # Consecutive failed iterations
         
-        while self._monitoring_active:
+        while self._monitoring_active and generation == self._monitor_generation:
             try:
                 # Check if we have a playlist to monitor
                 if not self._current_playlist_id:
-                    time.sleep(2.0)
+                    if generation != self._monitor_generation or stop_wait(idle_interval):
+                        break
+                    idle_interval = min(idle_interval * 1.5, max_interval)
                     continue
                 
-                # Check current playback state
-                currently_playing = self.is_playing()
+                # When the local MPRIS player says it's playing, that (and its track position)
+                # is all this check needs - skip the Web API request
+                currently_playing = self._prefer_mpris and is_playing()
+                if currently_playing and self._mpris_playing_recently():
+                    playback = None
+                else:
+                    # Force a fresh playback read; is_playing() below reuses it from the cache
+                    playback = get_playback(max_age=0, max_429_retries=0)
+                    currently_playing = is_playing()
+                at_track_end = not currently_playing and self._stopped_at_track_end(playback)
                 
                 if currently_playing:
                     # Reset counter if playing
                     consecutive_stopped_checks = 0
-                    self._was_playing = True
-                elif self._was_playing and not self._is_paused:
+                    was_playing = True
+                    idle_interval = min_interval
+                    # Sleep until shortly after the current track should end
+                    interval = self._next_monitor_interval(playback, currently_playing)
+                else:
                     # Was playing but now stopped (and not paused) - playlist might have ended
-                    consecutive_stopped_checks += 1
-                    
-                    if consecutive_stopped_checks >= required_stopped_checks:
+                    consecutive_stopped_checks, ended = self._check_playlist_ended(
+                        consecutive_stopped_checks, was_playing, at_track_end
+                    )
+                    if ended:
+                        if generation != self._monitor_generation:
+                            break  # Stopped/restarted while we were checking - not ours to report
                         # Playlist has ended naturally
                         logger.info("Spotify playlist ended - notifying callback to cycle to next source")
-                        self._was_playing = False
-                        self._notify_playback_ended()
-                        # Stop monitoring since we've notified
+                        was_playing = False
+                        # Stop monitoring before notifying, so the callback can start it again
                         self._monitoring_active = False
+                        self._notify_playback_ended()
                         break
-                else:
-                    # Not playing and was already stopped (or paused) - reset
-                    consecutive_stopped_checks = 0
-                    self._was_playing = False
+                    if consecutive_stopped_checks:
+                        # Keep the confirmation checks short
+                        interval = 1.0 if at_track_end else min_interval
+                    else:
+                        # Already stopped (or paused) - nothing can end, so back off
+                        # towards the maximum interval
+                        was_playing = False
+                        interval = idle_interval
+                        idle_interval = min(idle_interval * 1.5, max_interval)
                 
-                # Sleep before next check
-                time.sleep(2.0)  # Check every 2 seconds
+                error_backoff = 0.1
+                error_count = 0
+                if generation != self._monitor_generation or stop_wait(interval):
+                    break  # Superseded while polling, or told to stop
                 
             except Exception as e:
-                logger.error(f"Error in Spotify playback monitoring thread: {e}")
-                # Continue monitoring despite errors
-                time.sleep(2.0)
+                # Continue monitoring despite errors; most (e.g. raspotify restarting) clear up
+                # quickly, so retry soon and only log the first of a run and every 10th after
+                error_count += 1
+                if error_count == 1 or error_count % 10 == 0:
+                    logger.error("Error in Spotify playback monitoring thread (x%d): %s", error_count, e)
+                if generation != self._monitor_generation or stop_wait(error_backoff):
+                    break
+                error_backoff = min(error_backoff * 2, 5.0)
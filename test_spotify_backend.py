@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+"""Tests for the Spotify backend's Web API error handling, caches and playback monitor.
+
+spotipy is replaced by a stub client, so these run without network access,
+credentials or raspotify.
+"""
+import types
+
+import pytest
+
+import backends.spotify_backend as sb
+
+
+class FakeSpotifyException(Exception):
+    """Stand-in for spotipy.exceptions.SpotifyException."""
+
+    def __init__(self, http_status, code=-1, msg='', reason=None, headers=None):
+        super().__init__(msg)
+        self.http_status = http_status
+        self.code = code
+        self.msg = msg
+        self.headers = headers
+
+
+class FakeRequestException(Exception):
+    """Stand-in for requests.RequestException."""
+
+
+class FakeConnectionError(FakeRequestException):
+    """Stand-in for requests.ConnectionError."""
+
+
+class FakeOauthError(Exception):
+    """Stand-in for spotipy.oauth2.SpotifyOauthError."""
+
+
+class FakeClient:
+    """
+    Stub spotipy client.
+
+    Each Web API method pops its next outcome from a per-method script: an exception
+    is raised, anything else is returned. Calls made after the script runs out
+    return the default for that method.
+    """
+
+    def __init__(self, **scripts):
+        self.scripts = {name: list(outcomes) for name, outcomes in scripts.items()}
+        self.calls = []
+
+    def _call(self, name, default=None, **kwargs):
+        self.calls.append((name, kwargs))
+        script = self.scripts.get(name)
+        outcome = script.pop(0) if script else default
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def count(self, name):
+        return sum(1 for call, _ in self.calls if call == name)
+
+    def album(self, album_id, **kwargs):
+        return self._call('album', album_id=album_id, **kwargs)
+
+    def current_playback(self, **kwargs):
+        return self._call('current_playback', **kwargs)
+
+    def devices(self, **kwargs):
+        return self._call('devices', default={'devices': []}, **kwargs)
+
+    def next_track(self, **kwargs):
+        return self._call('next_track', **kwargs)
+
+    def pause_playback(self, **kwargs):
+        return self._call('pause_playback', **kwargs)
+
+    def playlist_tracks(self, playlist_id, **kwargs):
+        return self._call('playlist_tracks', playlist_id=playlist_id, **kwargs)
+
+    def shuffle(self, **kwargs):
+        return self._call('shuffle', **kwargs)
+
+    def start_playback(self, **kwargs):
+        return self._call('start_playback', **kwargs)
+
+
+def playback(track_id, context_uri='spotify:playlist:new', is_playing=True, shuffle_state=False):
+    """Build a current_playback() payload."""
+    return {
+        'is_playing': is_playing,
+        'shuffle_state': shuffle_state,
+        'context': {'uri': context_uri},
+        'item': {'id': track_id, 'name': track_id, 'artists': [{'name': 'Artist'}]},
+    }
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace time.monotonic/time.sleep in the backend with a clock that only moves when slept on."""
+    clock = types.SimpleNamespace(now=1000.0, sleeps=[])
+
+    def sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(sb.time, 'monotonic', lambda: clock.now)
+    monkeypatch.setattr(sb.time, 'sleep', sleep)
+    return clock
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """A SpotifyBackend on a stub client, with no network, D-Bus or background threads."""
+    monkeypatch.setattr(sb, 'SpotifyException', FakeSpotifyException)
+    monkeypatch.setattr(sb, 'requests', types.SimpleNamespace(
+        RequestException=FakeRequestException, ConnectionError=FakeConnectionError
+    ))
+    monkeypatch.setattr(sb, 'spotipy', types.SimpleNamespace(
+        oauth2=types.SimpleNamespace(SpotifyOauthError=FakeOauthError)
+    ))
+    monkeypatch.setattr(sb, '_import_spotipy', lambda: True)
+    for name in ('_init_spotify', '_init_systemd', '_start_token_refresh_thread'):
+        monkeypatch.setattr(sb.SpotifyBackend, name, lambda self, *args, **kwargs: None)
+
+    instance = sb.SpotifyBackend()
+    instance._spotify = FakeClient()
+    instance.refreshes = 0
+
+    def refresh():
+        instance.refreshes += 1
+
+    instance._refresh_token_in_place = refresh
+    return instance
+
+
+def test_http_session_leaves_429_and_exhausted_5xx_to_the_backend(monkeypatch):
+    """The adapter must not sleep on Retry-After, nor raise exhausted 5xx retries as a RetryError."""
+    captured = {}
+
+    class FakeSession:
+        def mount(self, prefix, adapter):
+            captured['prefix'] = prefix
+
+    monkeypatch.setattr(sb, 'requests', types.SimpleNamespace(Session=FakeSession))
+    monkeypatch.setattr(sb, 'HTTPAdapter', lambda **kwargs: captured.setdefault('adapter', kwargs))
+    monkeypatch.setattr(sb, 'Retry', lambda **kwargs: captured.setdefault('retry', kwargs))
+
+    sb._build_http_session()
+
+    retry = captured['retry']
+    assert 429 not in retry['status_forcelist']
+    assert 503 in retry['status_forcelist']
+    assert retry['respect_retry_after_header'] is False
+    assert retry['raise_on_status'] is False
+
+
+def test_5xx_outage_trips_the_breaker_not_the_rate_limit(backend, fake_clock):
+    """A 503 outage counts towards the circuit breaker and is not retried as a rate limit."""
+    threshold = backend._web_api_failure_threshold
+    backend._spotify = FakeClient(current_playback=[FakeSpotifyException(503)] * threshold)
+
+    for _ in range(threshold):
+        with pytest.raises(FakeSpotifyException):
+            backend._get_playback(max_age=0)
+
+    assert backend._spotify.count('current_playback') == threshold  # One request per call, no 429 retries
+    assert backend._rate_limited_until == 0.0
+    assert fake_clock.sleeps == []
+
+    # The breaker is open: the next call fails without a request
+    with pytest.raises(FakeConnectionError):
+        backend._get_playback(max_age=0)
+    assert backend._spotify.count('current_playback') == threshold
+
+
+def test_cache_hits_do_not_reset_the_failure_count(backend, fake_clock):
+    """Only a real request that succeeds closes the breaker's failure run."""
+    backend._spotify = FakeClient(current_playback=[playback('a'), FakeSpotifyException(503)])
+    backend._get_playback(max_age=0)
+    with pytest.raises(FakeSpotifyException):
+        backend._get_playback(max_age=0)
+    backend._playback_cache = (playback('a'), fake_clock.now)  # A fresh cached response
+    backend._devices_cache = (fake_clock.now, {'devices': []})
+
+    backend._get_playback()
+    backend._devices_cached()
+
+    assert backend._web_api_failures == 1
+    assert backend._spotify.count('current_playback') == 2
+    assert backend._spotify.count('devices') == 0
+
+
+def test_half_open_circuit_lets_a_single_trial_call_through(backend, fake_clock):
+    """After the open period only one call reaches the API; others fail fast until it answers."""
+    backend._web_api_failures = backend._web_api_failure_threshold
+    backend._web_api_open_until = fake_clock.now + 1.0
+    concurrent_errors = []
+
+    class TrialClient(FakeClient):
+        def current_playback(self, **kwargs):
+            # Another caller arriving while the trial call is in flight
+            try:
+                backend._api_call('devices')
+            except FakeConnectionError as e:
+                concurrent_errors.append(e)
+            return super().current_playback(**kwargs)
+
+    backend._spotify = TrialClient(current_playback=[playback('a')])
+    with pytest.raises(FakeConnectionError):
+        backend._get_playback(max_age=0)  # Still open
+    fake_clock.now += 1.0
+
+    assert backend._get_playback(max_age=0) == playback('a')
+    assert len(concurrent_errors) == 1
+    assert backend._spotify.count('devices') == 0
+    assert backend._web_api_open_until == 0.0 and backend._web_api_failures == 0
+
+
+def test_failed_trial_call_reopens_the_circuit(backend, fake_clock):
+    """A trial call that fails opens the circuit for another full period."""
+    backend._web_api_failures = backend._web_api_failure_threshold
+    backend._web_api_open_until = fake_clock.now
+    backend._spotify = FakeClient(current_playback=[FakeConnectionError('down')])
+
+    with pytest.raises(FakeConnectionError):
+        backend._get_playback(max_age=0)
+
+    assert backend._web_api_open_until == fake_clock.now + backend._web_api_reset_after
+    assert not backend._web_api_probe_lock.locked()
+
+
+def test_start_playback_429_sets_the_rate_limit_hold_off(backend, fake_clock):
+    """Playback commands share the rate-limit hold-off with every other Web API call."""
+    limited = FakeSpotifyException(429, headers={'Retry-After': '30'})
+    backend._spotify = FakeClient(start_playback=[limited])
+
+    with pytest.raises(FakeSpotifyException):
+        backend._send_player_command('start_playback', device_id='dev', context_uri='spotify:album:x')
+
+    assert backend._rate_limited_until == fake_clock.now + 30
+    with pytest.raises(FakeSpotifyException) as held:
+        backend._get_playback(max_age=0)
+    assert held.value.http_status == 429
+    assert backend._spotify.count('current_playback') == 0
+
+
+def test_unconfirmed_start_keeps_the_current_item(backend, fake_clock, monkeypatch):
+    """If the new context never shows up, the previous item is kept, not cleared or replaced by the old track."""
+    monkeypatch.setattr(backend, '_start_monitoring', lambda: None)
+    backend._device_id = 'dev'
+    backend._apply_playback_to_current(playback('old', context_uri='spotify:playlist:old'))
+    stale = playback('old', context_uri='spotify:playlist:old')
+    backend._spotify = FakeClient(current_playback=[stale] * 50)
+
+    backend._do_playback('spotify:playlist:new', None)
+
+    assert backend._current_track_id == 'old'
+    assert backend.get_current_item() == 'Artist - old'
+    assert backend._spotify.count('shuffle') == 1  # Shuffle state of the new context is unknown
+
+
+def test_late_start_is_picked_up_by_the_final_look(backend, fake_clock, monkeypatch):
+    """A context that shows up right after the wait times out is still applied."""
+    monkeypatch.setattr(backend, '_start_monitoring', lambda: None)
+    backend._device_id = 'dev'
+    monkeypatch.setattr(backend, '_wait_for_track_change', lambda *args, **kwargs: None)
+    backend._spotify = FakeClient(current_playback=[playback('new')])
+
+    backend._do_playback('spotify:playlist:new', None)
+
+    assert backend.get_current_item() == 'Artist - new'
+
+
+def test_mpris_player_is_searched_for_again_and_preferred_once_found(backend, fake_clock, monkeypatch):
+    """A player that appears after the first D-Bus search is picked up on a later one."""
+    searches = []
+
+    def init_mpris():
+        searches.append(fake_clock.now)
+        if len(searches) == 2:
+            backend._mpris_player = object()
+
+    monkeypatch.setattr(backend, '_init_mpris', init_mpris)
+    monkeypatch.setattr(backend, '_probe_web_api_playing', lambda: False)
+    monkeypatch.setattr(backend, '_probe_mpris_playing', lambda: None)
+    backend._playing_probes = (backend._probe_web_api_playing, backend._probe_mpris_playing)
+    backend._prefer_mpris = False
+
+    backend._check_is_playing()
+    fake_clock.now += backend._mpris_reprobe_interval / 2
+    backend._check_is_playing()
+    assert len(searches) == 1 and not backend._prefer_mpris
+
+    fake_clock.now += backend._mpris_reprobe_interval / 2
+    backend._check_is_playing()
+    assert len(searches) == 2 and backend._prefer_mpris
+
+
+def test_playlist_end_needs_consecutive_stopped_checks(backend):
+    """A stop after playing is confirmed after three checks, or two right at a track's end."""
+    assert backend._check_playlist_ended(0, True, False) == (1, False)
+    assert backend._check_playlist_ended(2, True, False) == (3, True)
+    assert backend._check_playlist_ended(1, True, True) == (2, True)
+    assert backend._check_playlist_ended(2, False, False) == (0, False)  # Was already stopped
+
+
+def test_pause_is_not_a_playlist_end(backend):
+    """A reported pause resets the count, unless it is really a stop at a track's end."""
+    backend._paused_event.set()
+    assert backend._check_playlist_ended(2, True, False) == (0, False)
+    assert backend._check_playlist_ended(1, True, True) == (2, True)
+
+    backend._pause_requested = True  # pause() was pressed, so the pause wins even at a track's end
+    assert backend._check_playlist_ended(1, True, True) == (0, False)
+
+
+def test_monitor_reports_the_end_once_and_stops(backend):
+    """The monitor notifies the ended callback once and stops itself before doing so."""
+    states = iter([True, False, False, False])
+    ended = []
+    backend._current_playlist_id = 'playlist'
+    backend._prefer_mpris = False
+    backend._get_playback = lambda max_age=None, **kwargs: None
+    backend.is_playing = lambda: next(states)
+    backend.set_on_playback_ended_callback(lambda: ended.append(backend._monitoring_active))
+    backend._monitoring_active = True
+    stop_event = types.SimpleNamespace(wait=lambda timeout: False)
+
+    backend._monitor_playback(backend._monitor_generation, stop_event)
+
+    assert ended == [False]
+
+
+def test_with_retry_waits_out_retry_after(fake_clock, monkeypatch):
+    """A 429 is retried after the server's Retry-After."""
+    monkeypatch.setattr(sb, 'SpotifyException', FakeSpotifyException)
+    client = FakeClient(current_playback=[FakeSpotifyException(429, headers={'Retry-After': '3'}), playback('a')])
+
+    assert sb._with_retry(client.current_playback) == playback('a')
+    assert fake_clock.sleeps == [3.0]
+
+
+def test_with_retry_backs_off_exponentially_without_retry_after(fake_clock, monkeypatch):
+    """Without a Retry-After each retry waits twice as long, and the last 429 is raised."""
+    monkeypatch.setattr(sb, 'SpotifyException', FakeSpotifyException)
+    client = FakeClient(current_playback=[FakeSpotifyException(429)] * 3)
+
+    with pytest.raises(FakeSpotifyException):
+        sb._with_retry(client.current_playback, max_429_retries=2)
+    assert fake_clock.sleeps == [sb._RATE_LIMIT_BASE_DELAY, sb._RATE_LIMIT_BASE_DELAY * 2]
+    assert client.count('current_playback') == 3
+
+
+def test_with_retry_gives_up_on_long_retry_after_and_other_errors(fake_clock, monkeypatch):
+    """A Retry-After above the cap, or any other error, is raised without waiting."""
+    monkeypatch.setattr(sb, 'SpotifyException', FakeSpotifyException)
+    too_long = str(int(sb._MAX_RETRY_AFTER) + 1)
+    client = FakeClient(current_playback=[
+        FakeSpotifyException(429, headers={'Retry-After': too_long}), FakeSpotifyException(404)
+    ])
+
+    for _ in range(2):
+        with pytest.raises(FakeSpotifyException):
+            sb._with_retry(client.current_playback)
+    assert fake_clock.sleeps == []
+    assert client.count('current_playback') == 2
+
+
+def test_401_refreshes_the_token_once_and_retries(backend, fake_clock):
+    """An expired token is refreshed and the call made again."""
+    backend._spotify = FakeClient(current_playback=[FakeSpotifyException(401), playback('a')])
+
+    assert backend._get_playback(max_age=0) == playback('a')
+    assert backend.refreshes == 1
+
+
+def test_401_after_refresh_is_raised(backend, fake_clock):
+    """A token that is still rejected after a refresh is not refreshed again."""
+    backend._spotify = FakeClient(current_playback=[FakeSpotifyException(401)] * 2)
+
+    with pytest.raises(FakeSpotifyException) as failed:
+        backend._get_playback(max_age=0)
+    assert failed.value.http_status == 401
+    assert backend.refreshes == 1
+    assert backend._spotify.count('current_playback') == 2
+
+
+def test_401_during_refresh_does_not_refresh_again(backend, fake_clock):
+    """A Web API call made by the refresh itself doesn't start a nested refresh."""
+    backend._spotify = FakeClient(current_playback=[FakeSpotifyException(401), playback('a')],
+                                  devices=[FakeSpotifyException(401)])
+    nested = []
+
+    def refresh():
+        backend.refreshes += 1
+        try:
+            backend._api_call('devices')  # e.g. verifying the new token
+        except FakeSpotifyException as e:
+            nested.append(e.http_status)
+
+    backend._refresh_token_in_place = refresh
+
+    assert backend._get_playback(max_age=0) == playback('a')
+    assert backend.refreshes == 1
+    assert nested == [401]
+    assert not backend._refreshing_token
+
+
+def test_rate_limit_hold_off_expires(backend, fake_clock):
+    """Calls fail without a request during the hold-off and go through again after it."""
+    backend._spotify = FakeClient(current_playback=[
+        FakeSpotifyException(429, headers={'Retry-After': '20'}), playback('a')
+    ])
+
+    with pytest.raises(FakeSpotifyException):
+        backend._get_playback(max_age=0)  # Longer than _MAX_RETRY_AFTER, so not waited out
+    with pytest.raises(FakeSpotifyException):
+        backend._get_playback(max_age=0)
+    assert backend._spotify.count('current_playback') == 1
+
+    fake_clock.now += 20
+    assert backend._get_playback(max_age=0) == playback('a')
+
+
+def test_playback_is_cached_until_a_command_changes_it(backend, fake_clock):
+    """Reads within the TTL share one request; max_age=0 and player commands force a fresh one."""
+    backend._spotify = FakeClient(current_playback=[playback('a'), playback('b'), playback('c')])
+
+    assert backend._get_playback() == playback('a')
+    fake_clock.now += backend._playback_ttl / 2
+    assert backend._get_playback() == playback('a')
+    assert backend._get_playback(max_age=0) == playback('b')
+
+    backend._send_player_command('next_track', device_id='dev')
+    assert backend._get_playback() == playback('c')
+    assert backend._spotify.count('current_playback') == 3
+
+
+def test_wait_for_track_change_returns_the_new_track(backend, fake_clock):
+    """Polling stops as soon as another track plays, with the delays backing off."""
+    backend._spotify = FakeClient(current_playback=[playback('a'), playback('a'), playback('b')])
+
+    assert backend._wait_for_track_change('a') == playback('b')
+    assert fake_clock.sleeps == list(sb._TRACK_CHANGE_POLL_DELAYS[:2])
+
+
+def test_wait_for_track_change_ignores_the_previous_context(backend, fake_clock):
+    """With a context, a different track from the old context doesn't count."""
+    old_context = playback('b', context_uri='spotify:playlist:old')
+    backend._spotify = FakeClient(current_playback=[old_context, playback('c')])
+
+    assert backend._wait_for_track_change('a', context_uri='spotify:playlist:new') == playback('c')
+
+
+def test_wait_for_track_change_accepts_the_same_track_only_at_the_timeout(backend, fake_clock):
+    """The new context may start on the previous track; that is returned once nothing else shows up."""
+    backend._spotify = FakeClient(current_playback=[playback('a')] * 50)
+    start = fake_clock.now
+
+    assert backend._wait_for_track_change('a', timeout=2.0, context_uri='spotify:playlist:new') == playback('a')
+    assert fake_clock.now - start == pytest.approx(2.0)
+
+
+def test_wait_for_track_change_without_the_context_returns_none(backend, fake_clock):
+    """Playback from the new context never showing up (or failing polls) gives None."""
+    backend._spotify = FakeClient(current_playback=[
+        FakeConnectionError('down'), playback('b', context_uri='spotify:playlist:old'),
+        playback('c', is_playing=False),
+    ] + [None] * 50)
+
+    assert backend._wait_for_track_change('a', timeout=2.0, context_uri='spotify:playlist:new') is None
+
+
+def test_track_counts_are_cached_per_uri(backend, fake_clock):
+    """Playlist counts are re-fetched after the TTL; album counts never change."""
+    backend._spotify = FakeClient(playlist_tracks=[{'total': 10}, {'total': 12}],
+                                  album=[{'tracks': {'total': 8}}])
+
+    assert backend._get_track_count('spotify:playlist:p') == 10
+    assert backend._get_track_count('spotify:album:a') == 8
+    fake_clock.now += backend._track_count_ttl / 2
+    assert backend._get_track_count('spotify:playlist:p') == 10
+    fake_clock.now += backend._track_count_ttl
+    assert backend._get_track_count('spotify:playlist:p') == 12
+    assert backend._get_track_count('spotify:album:a') == 8
+    assert backend._get_track_count('spotify:track:t') == 1
+
+    assert backend._spotify.count('playlist_tracks') == 2
+    assert backend._spotify.count('album') == 1
+
+
+def test_track_count_cache_drops_the_oldest_uri(backend, fake_clock):
+    """The cache holds at most _track_count_cache_size URIs, dropping the least recently fetched."""
+    backend._track_count_cache_size = 2
+    backend._spotify = FakeClient(album=[{'tracks': {'total': n}} for n in (1, 2, 3, 4)])
+
+    for album_id in ('a', 'b', 'c'):
+        backend._get_track_count(f'spotify:album:{album_id}')
+
+    assert list(backend._track_count_cache) == ['spotify:album:b', 'spotify:album:c']
+    assert backend._get_track_count('spotify:album:a') == 4  # Fetched again
+    assert backend._spotify.count('album') == 4
+
+
+def test_playing_state_probe_does_not_sleep_on_429(backend, fake_clock):
+    """is_playing() runs under the controller's lock, so its Web API probe fails fast on a 429."""
+    backend._spotify = FakeClient(current_playback=[FakeSpotifyException(429, headers={'Retry-After': '2'})])
+
+    assert backend._probe_web_api_playing() is None
+    assert fake_clock.sleeps == []
+    assert backend._spotify.count('current_playback') == 1
+
+
+def test_atomic_write_keeps_the_file_mode(tmp_path):
+    """Rewriting the token cache keeps its permissions; a new file is private to the user."""
+    existing = tmp_path / 'token.json'
+    existing.write_text('{}')
+    existing.chmod(0o640)
+
+    sb._atomic_write_json(existing, {'access_token': 'a'})
+    sb._atomic_write_json(tmp_path / 'new.json', {'access_token': 'b'})
+
+    assert sb.json.loads(existing.read_text()) == {'access_token': 'a'}
+    assert existing.stat().st_mode & 0o777 == 0o640
+    assert (tmp_path / 'new.json').stat().st_mode & 0o777 == 0o600
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_unreadable_config_is_a_backend_error(backend, monkeypatch):
+    """Any error reading the config (not just a missing file) surfaces as a BackendError."""
+    def stat(path):
+        raise PermissionError(13, 'Permission denied', str(path))
+
+    monkeypatch.setattr(sb.os, 'stat', stat)
+
+    with pytest.raises(sb.BackendError, match='Permission denied'):
+        backend._load_config()